@@ -7,10 +7,40 @@ extracted from player_profile_old.py and team_stats_old.py.
 
 import plotly.express as px
 import polars as pl
+import streamlit as st
 from typing import Optional
 from plotly.graph_objects import Figure
 
 
+def long_metric_df(
+    data: pl.DataFrame, x_col: str, metrics: list[str], metric_names: dict
+) -> pl.DataFrame:
+    """
+    Reshape metric columns to one row per x value and metric for line/bar charts.
+
+    Args:
+        data (pl.DataFrame): Data with one column per metric
+        x_col (str): Column used as the x axis
+        metrics (list): Metric columns to keep
+        metric_names (dict): Mapping of metric columns to display names,
+            unmapped metrics are upper-cased
+
+    Returns:
+        pl.DataFrame: Data with x_col, games_played, metric and value columns
+    """
+    if "games_played" not in data.columns:
+        data = data.with_columns(pl.lit(0).alias("games_played"))
+
+    return data.unpivot(
+        on=metrics, index=[x_col, "games_played"], variable_name="metric"
+    ).with_columns(
+        pl.col("metric").replace_strict(
+            {metric: metric_names.get(metric, metric.upper()) for metric in metrics}
+        )
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=100)
 def season_metric_chart(
     trend_data: pl.DataFrame,
     splits_df: pl.DataFrame,
@@ -88,6 +118,7 @@ def season_metric_chart(
     return fig_trend
 
 
+@st.cache_data(show_spinner=False, max_entries=100)
 def career_metric_chart(
     season_data: pl.DataFrame,
     metric: str,
@@ -135,6 +166,7 @@ def career_metric_chart(
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=100)
 def player_shot_chart(player_season_trend, shot_categories_selected):
     """
     Create a multi-line chart showing shooting statistics over seasons.
@@ -162,46 +194,37 @@ def player_shot_chart(player_season_trend, shot_categories_selected):
         "Free Throws": ["#008300", "#4DFF4D", "#99FF99"],  # Green shades
     }
 
-    # Generate data based on selected shooting stat categories
-    shooting_stats_data = []
-    for category in shot_categories_selected:
-        selected_stats = shooting_stats[category]
-
-        for stat in selected_stats:
-            # Set appropriate metric name for display
-            metric_names = {
-                "fg_pct": "FG%",
-                "fgm": "FGM",
-                "fga": "FGA",
-                "two_p_pct": "2P%",
-                "two_pm": "2PM",
-                "two_pa": "2PA",
-                "three_p_pct": "3P%",
-                "three_pm": "3PM",
-                "three_pa": "3PA",
-                "ft_pct": "FT%",
-                "ftm": "FTM",
-                "fta": "FTA",
-            }
-
-            metric_name = metric_names.get(stat, stat.upper())
-
-            # Add data points for this stat
-            for row in player_season_trend.iter_rows(named=True):
-                shooting_stats_data.append(
-                    {
-                        "season": row["season"],
-                        "value": row[stat],
-                        "metric": metric_name,
-                        "games_played": row.get("games_played", 0),
-                    }
-                )
+    # Set appropriate metric name for display
+    metric_names = {
+        "fg_pct": "FG%",
+        "fgm": "FGM",
+        "fga": "FGA",
+        "two_p_pct": "2P%",
+        "two_pm": "2PM",
+        "two_pa": "2PA",
+        "three_p_pct": "3P%",
+        "three_pm": "3PM",
+        "three_pa": "3PA",
+        "ft_pct": "FT%",
+        "ftm": "FTM",
+        "fta": "FTA",
+    }
+
+    # Stats of the selected shooting stat categories
+    selected_stats = [
+        stat
+        for category in shot_categories_selected
+        for stat in shooting_stats[category]
+    ]
 
     # Only create visualization if data is available
-    if not shooting_stats_data:
+    if not selected_stats or player_season_trend.is_empty():
         return None
 
-    shooting_stats_df = pl.DataFrame(shooting_stats_data)
+    # One row per season and stat
+    shooting_stats_df = long_metric_df(
+        player_season_trend, "season", selected_stats, metric_names
+    )
 
     # Create a color sequence for all metrics
     color_sequence = []
@@ -233,24 +256,23 @@ def player_shot_chart(player_season_trend, shot_categories_selected):
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=100)
 def win_percentage_chart(win_pct_data, reference_line=50):
     """
     Create a bar chart showing win percentages by team/location.
 
     Args:
-        win_pct_data (list): List of dictionaries with 'Team' and 'value' keys
+        win_pct_data (pl.DataFrame): Data with 'Team' and 'value' columns
         reference_line (float, optional): Value for reference line. Defaults to 50.
 
     Returns:
         plotly.graph_objects.Figure: The plotly figure object
     """
-    if not win_pct_data:
+    if win_pct_data.is_empty():
         return None
 
-    # Convert to DataFrame and format percentages
-    win_pct_df = pl.DataFrame(win_pct_data)
-    if "value" in win_pct_df.columns:
-        win_pct_df = win_pct_df.with_columns(pl.col("value").mul(100).round(1))
+    # Format percentages
+    win_pct_df = win_pct_data.with_columns(pl.col("value").mul(100).round(1))
 
     # Create win percentage bar chart
     fig = px.bar(
@@ -277,6 +299,7 @@ def win_percentage_chart(win_pct_data, reference_line=50):
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=100)
 def win_percentage_opponent_chart(
     win_pct_data: pl.DataFrame, reference_line: float = 0.5
 ):
@@ -315,6 +338,7 @@ def win_percentage_opponent_chart(
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=100)
 def team_performance_trend_chart(
     season_trend, metric="win_percentage", y_label=None, format_as_percent=False
 ):
@@ -360,6 +384,7 @@ def team_performance_trend_chart(
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=100)
 def opponent_comparison_chart(
     vs_data: pl.DataFrame, metric_columns: list[str], metric_names=None
 ):
@@ -378,19 +403,12 @@ def opponent_comparison_chart(
         metric_names = {col: col.replace("_", " ").title() for col in metric_columns}
 
     # Prepare data for visualization
-    chart_data = []
-    for col in metric_columns:
-        for row in vs_data.iter_rows(named=True):
-            chart_data.append(
-                {
-                    "opponent": row["opponent"],
-                    "value": row[col],
-                    "metric": metric_names.get(col, col),
-                    "games_played": row.get("games_played", 0),
-                }
-            )
-
-    chart_df = pl.DataFrame(chart_data)
+    chart_df = long_metric_df(
+        vs_data,
+        "opponent",
+        metric_columns,
+        {col: metric_names.get(col, col) for col in metric_columns},
+    )
 
     # Create the visualization
     fig = px.bar(
@@ -411,6 +429,7 @@ def opponent_comparison_chart(
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=100)
 def multi_metric_season_chart(
     season_data: pl.DataFrame, metrics: list[str], metric_names=None, colors=None
 ):
@@ -430,20 +449,7 @@ def multi_metric_season_chart(
         metric_names = {m: m.upper() for m in metrics}
 
     # Prepare data for visualization
-    chart_data = []
-    for metric in metrics:
-        display_name = metric_names.get(metric, metric.upper())
-        for row in season_data.iter_rows(named=True):
-            chart_data.append(
-                {
-                    "season": row["season"],
-                    "value": row[metric],
-                    "metric": display_name,
-                    "games_played": row.get("games_played", 0),
-                }
-            )
-
-    chart_df = pl.DataFrame(chart_data)
+    chart_df = long_metric_df(season_data, "season", metrics, metric_names)
 
     # Create the visualization
     fig = px.line(
@@ -467,6 +473,7 @@ def multi_metric_season_chart(
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=100)
 def location_bar_chart(
     data: pl.DataFrame, metric_name: str, y_suffix: str = ""
 ) -> Figure:
@@ -499,6 +506,7 @@ def location_bar_chart(
     return fig_splits
 
 
+@st.cache_data(show_spinner=False, max_entries=100)
 def stat_bar_chart(
     data: pl.DataFrame,
     x_col: str,
@@ -515,6 +523,9 @@ def stat_bar_chart(
     """
     Create a bar chart for a specific statistic.
 
+    Figures are cached on the input data and arguments, so reruns with unchanged
+    data reuse the previously built figure.
+
     Args:
         data (pl.DataFrame): Data to visualize
         x_col (str): Column name for x-axis
@@ -5,7 +5,6 @@ Components for displaying game cards and game-related UI elements.
 
 import streamlit as st
 from typing import Any
-from datetime import datetime
 import polars as pl
 
 from utils.app_state import AppState
@@ -60,8 +59,8 @@ def games_calendar_view(
     Display games in a calendar view grouped by date.
 
     Args:
-        games_df: DataFrame with games data
-        dates_df: DataFrame with unique dates
+        games_df: DataFrame with games data sorted by date
+        dates_df: DataFrame with unique dates and their row offsets in games_df
         current_page: Current page index
         dates_per_page: Number of dates to display per page
     """
@@ -105,12 +104,10 @@ def games_calendar_view(
     current_page_dates = dates_df.slice(start_idx, end_idx - start_idx)
 
     for _, row in enumerate(current_page_dates.iter_rows(named=True)):
-        date_str = row["date_str"]
-        date_games = games_df.filter(pl.col("date_str") == date_str)
+        date_games = games_df.slice(row["offset"], row["games_count"])
 
-        # Format date header
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        st.subheader(date_obj.strftime("%A, %B %d, %Y"))
+        # Date header
+        st.subheader(row["date_label"])
 
         # Create game cards grid
         cols = st.columns(min(3, len(date_games)))
@@ -34,13 +34,38 @@ def two_column_layout(
         right_content()
 
 
-def tabbed_interface(tabs_dict: Dict[str, Callable], default_tab: Optional[str] = None):
+def metrics_row(metrics: Dict[str, str]):
+    """
+    Display a row of metric cards with a single markdown element.
+
+    Args:
+        metrics: Dictionary mapping metric labels to formatted values
+    """
+    cards = "".join(
+        "<div style='flex:1'>"
+        f"<div style='font-size:0.875rem;opacity:0.7'>{label}</div>"
+        f"<div style='font-size:2.25rem;line-height:1.4'>{value}</div>"
+        "</div>"
+        for label, value in metrics.items()
+    )
+    st.markdown(
+        f"<div style='display:flex;gap:1rem'>{cards}</div>", unsafe_allow_html=True
+    )
+
+
+def tabbed_interface(
+    tabs_dict: Dict[str, Callable],
+    default_tab: Optional[str] = None,
+    fragments: bool = False,
+):
     """
     Create a tabbed interface with custom content in each tab.
 
     Args:
         tabs_dict: Dictionary mapping tab names to content functions
         default_tab: Optional default tab to select
+        fragments: Whether to render each tab as a fragment, so that widget
+            interactions inside a tab only rerun that tab
     """
     tab_names = list(tabs_dict.keys())
 
@@ -50,7 +75,10 @@ def tabbed_interface(tabs_dict: Dict[str, Callable], default_tab: Optional[str]
     # Render content in each tab
     for i, tab_name in enumerate(tab_names):
         with tabs[i]:
-            tabs_dict[tab_name]()
+            if fragments:
+                st.fragment(tabs_dict[tab_name])()
+            else:
+                tabs_dict[tab_name]()
 
 
 def calendar_layout(
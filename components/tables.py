@@ -32,9 +32,10 @@ def stats_table(
         st.info("No data available.")
         return
 
-    # Display with the appropriate configuration
+    # Display with the appropriate configuration. Arrow tables are serialized
+    # as-is, while other frames are first converted to pandas by Streamlit
     st.dataframe(
-        df,
+        df.to_arrow(),
         column_config=column_config,
         height=height,
         hide_index=hide_index,
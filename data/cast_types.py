@@ -4,33 +4,36 @@ Functions for casting DataFrame columns to appropriate data types.
 """
 
 import polars as pl
+from typing import Union
 
 
 def cast_boxscore_columns(
-    data: pl.DataFrame, is_player_boxscore: bool = True
-) -> pl.DataFrame:
+    data: Union[pl.DataFrame, pl.LazyFrame], is_player_boxscore: bool = True
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Cast boxscore DataFrame columns to appropriate data types.
 
     Args:
-        data: DataFrame to cast
+        data: DataFrame or LazyFrame to cast
         is_player_boxscore: Whether the DataFrame is a player boxscore (True) or team boxscore (False)
 
     Returns:
-        DataFrame with properly typed columns
+        DataFrame or LazyFrame with properly typed columns
     """
+    columns = data.collect_schema().names()
+
     # Set string columns
     string_cols = ["game_id", "team", "opponent", "location"]
     if is_player_boxscore:
         string_cols.append("player_name")
 
     # Cast string columns
-    for col in string_cols:
-        if col in data.columns:
-            data = data.with_columns(pl.col(col).cast(pl.String))
+    data = data.with_columns(
+        pl.col(col).cast(pl.String) for col in string_cols if col in columns
+    )
 
     # Cast boolean column for player boxscore
-    if is_player_boxscore and "starter" in data.columns:
+    if is_player_boxscore and "starter" in columns:
         data = data.with_columns(
             pl.when(pl.col("starter") == 1).then(True).otherwise(False).alias("starter")
         )
@@ -42,7 +45,9 @@ def cast_boxscore_columns(
         return cast_teams_boxscore_columns(data)
 
 
-def cast_players_boxscore_columns(data: pl.DataFrame) -> pl.DataFrame:
+def cast_players_boxscore_columns(
+    data: Union[pl.DataFrame, pl.LazyFrame],
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Cast player boxscore columns to appropriate data types.
 
@@ -52,7 +57,7 @@ def cast_players_boxscore_columns(data: pl.DataFrame) -> pl.DataFrame:
         data: Player boxscore data with string columns
 
     Returns:
-        DataFrame with columns cast to appropriate numeric types
+        DataFrame or LazyFrame with columns cast to appropriate numeric types
     """
 
     return data.with_columns(
@@ -81,7 +86,9 @@ def cast_players_boxscore_columns(data: pl.DataFrame) -> pl.DataFrame:
     )
 
 
-def cast_teams_boxscore_columns(data: pl.DataFrame) -> pl.DataFrame:
+def cast_teams_boxscore_columns(
+    data: Union[pl.DataFrame, pl.LazyFrame],
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Cast team boxscore columns to appropriate data types.
 
@@ -91,17 +98,17 @@ def cast_teams_boxscore_columns(data: pl.DataFrame) -> pl.DataFrame:
         data: Team boxscore data with string columns
 
     Returns:
-        DataFrame with columns cast to appropriate numeric types
+        DataFrame or LazyFrame with columns cast to appropriate numeric types
     """
     # First handle empty strings in all columns
-    for col in data.columns:
-        if col not in ["team", "opponent", "location", "game_id"]:
-            data = data.with_columns(
-                pl.when(pl.col(col).cast(pl.String) == "")
-                .then(None)
-                .otherwise(pl.col(col))
-                .alias(col)
-            )
+    data = data.with_columns(
+        pl.when(pl.col(col).cast(pl.String) == "")
+        .then(None)
+        .otherwise(pl.col(col))
+        .alias(col)
+        for col in data.collect_schema().names()
+        if col not in ["team", "opponent", "location", "game_id"]
+    )
 
     return data.with_columns(
         pl.col("minutes_played").cast(pl.Int32, strict=False),
@@ -303,14 +303,17 @@ TEAM_SEASON_STATS_COLUMN_CONFIG = {
     "tpg": st.column_config.NumberColumn(
         "TOPG", format="%.1f", width="small", help="Turnovers Per Game"
     ),
+    "ast_to_ratio": st.column_config.NumberColumn(
+        "AST/TO", format="%.2f", width="small", help="Assist To Turnover Ratio"
+    ),
     "fg": st.column_config.NumberColumn(
         "FGM", format="%.1f", width="small", help="Field Goals Made Per Game"
     ),
     "fga": st.column_config.NumberColumn(
         "FGA", format="%.1f", width="small", help="Field Goals Attempted Per Game"
     ),
-    "fg_pct": st.column_config.TextColumn(
-        "FG%", width="small", help="Field Goal Percentage"
+    "fg_pct": st.column_config.NumberColumn(
+        "FG%", format="%.1f", width="small", help="Field Goal Percentage"
     ),
     "three_p": st.column_config.NumberColumn(
         "3PM", format="%.1f", width="small", help="3-Points Made Per Game"
@@ -318,8 +321,8 @@ TEAM_SEASON_STATS_COLUMN_CONFIG = {
     "three_pa": st.column_config.NumberColumn(
         "3PA", format="%.1f", width="small", help="3-Points Attempted Per Game"
     ),
-    "three_p_pct": st.column_config.TextColumn(
-        "3P%", width="small", help="3-Point Percentage"
+    "three_p_pct": st.column_config.NumberColumn(
+        "3P%", format="%.1f", width="small", help="3-Point Percentage"
     ),
     "two_ppg": st.column_config.NumberColumn(
         "2PM", format="%.1f", width="small", help="2-Points Made Per Game"
@@ -327,8 +330,8 @@ TEAM_SEASON_STATS_COLUMN_CONFIG = {
     "two_papg": st.column_config.NumberColumn(
         "2PA", format="%.1f", width="small", help="2-Points Attempted Per Game"
     ),
-    "two_p_pct": st.column_config.TextColumn(
-        "2P%", width="small", help="2-Point Percentage"
+    "two_p_pct": st.column_config.NumberColumn(
+        "2P%", format="%.1f", width="small", help="2-Point Percentage"
     ),
     "ft": st.column_config.NumberColumn(
         "FTM", format="%.1f", width="small", help="Free Throws Made Per Game"
@@ -336,8 +339,8 @@ TEAM_SEASON_STATS_COLUMN_CONFIG = {
     "fta": st.column_config.NumberColumn(
         "FTA", format="%.1f", width="small", help="Free Throws Attempted Per Game"
     ),
-    "ft_pct": st.column_config.TextColumn(
-        "FT%", width="small", help="Free Throw Percentage"
+    "ft_pct": st.column_config.NumberColumn(
+        "FT%", format="%.1f", width="small", help="Free Throw Percentage"
     ),
 }
 
@@ -382,6 +385,12 @@ PLAYER_SEASON_STATS_COLUMN_CONFIG = {
         width="small",
         help="Turnovers per game",
     ),
+    "ast_to_ratio": st.column_config.NumberColumn(
+        "AST/TO",
+        format="%.2f",
+        width="small",
+        help="Assist to turnover ratio",
+    ),
     "fg": st.column_config.NumberColumn(
         "FGM",
         format="%.1f",
@@ -412,8 +421,11 @@ PLAYER_SEASON_STATS_COLUMN_CONFIG = {
         width="small",
         help="2-point field goals attempted per game",
     ),
-    "two_p_pct": st.column_config.TextColumn(
-        "2P%", width="small", help="2-point shooting percentage (2PM/2PA)"
+    "two_p_pct": st.column_config.NumberColumn(
+        "2P%",
+        format="%.1f",
+        width="small",
+        help="2-point shooting percentage (2PM/2PA)",
     ),
     "three_p": st.column_config.NumberColumn(
         "3PM",
@@ -427,8 +439,11 @@ PLAYER_SEASON_STATS_COLUMN_CONFIG = {
         width="small",
         help="3-point field goals attempted per game",
     ),
-    "three_p_pct": st.column_config.TextColumn(
-        "3P%", width="small", help="3-point shooting percentage (3PM/3PA)"
+    "three_p_pct": st.column_config.NumberColumn(
+        "3P%",
+        format="%.1f",
+        width="small",
+        help="3-point shooting percentage (3PM/3PA)",
     ),
     "ft": st.column_config.NumberColumn(
         "FTM",
@@ -442,12 +457,17 @@ PLAYER_SEASON_STATS_COLUMN_CONFIG = {
         width="small",
         help="Free throws attempted per game",
     ),
-    "ft_pct": st.column_config.TextColumn(
-        "FT%", width="small", help="Free throw shooting percentage (FTM/FTA)"
+    "ft_pct": st.column_config.NumberColumn(
+        "FT%",
+        format="%.1f",
+        width="small",
+        help="Free throw shooting percentage (FTM/FTA)",
     ),
     "avg_minutes": st.column_config.NumberColumn(
         "MPG", format="%.1f", width="small", help="Minutes played per game"
     ),
+    # Helper column for ranking defenders, hidden from the table
+    "def_total": None,
 }
 
 PLAYER_GAME_LOG_COLUMN_CONFIG = {
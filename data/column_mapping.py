@@ -4,9 +4,9 @@ Functions for mapping between database column names and display column names.
 """
 
 import polars as pl
-from typing import Dict
+from typing import Dict, Union
 from utils.players import get_player_photo_url
-from utils.teams import get_team_logo_url
+from utils.teams import team_logo_url_expr
 
 # Team column mappings from database to display names
 TEAMS_COLUMN_MAPPING = {
@@ -63,24 +63,28 @@ PLAYERS_COLUMN_MAPPING = {
 }
 
 
-def rename_df_columns(df: pl.DataFrame, column_mapping: Dict[str, str]) -> pl.DataFrame:
+def rename_df_columns(
+    df: Union[pl.DataFrame, pl.LazyFrame], column_mapping: Dict[str, str]
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Rename columns in a DataFrame based on a mapping dictionary.
 
     Args:
-        df: DataFrame to rename columns in
+        df: DataFrame or LazyFrame to rename columns in
         column_mapping: Dictionary mapping old column names to new column names
 
     Returns:
-        DataFrame with renamed columns
+        DataFrame or LazyFrame with renamed columns
     """
-    df_renamed = df.clone()
-
-    for old_name, new_name in column_mapping.items():
-        if old_name in df.columns:
-            df_renamed = df_renamed.rename({old_name: new_name})
-
-    return df_renamed
+    columns = df.collect_schema().names()
+
+    return df.rename(
+        {
+            old_name: new_name
+            for old_name, new_name in column_mapping.items()
+            if old_name in columns and old_name != new_name
+        }
+    )
 
 
 def add_player_photo_url(df: pl.DataFrame) -> pl.DataFrame:
@@ -102,16 +106,12 @@ def add_player_photo_url(df: pl.DataFrame) -> pl.DataFrame:
 
 def add_team_logo_url(df: pl.DataFrame) -> pl.DataFrame:
     """
-    Add a column with the team's logo URL to the DataFrame.
+    Add a column with the team's logo URL in front of the DataFrame columns.
 
     Args:
         df (pl.DataFrame): The DataFrame containing team data.
 
     Returns:
-        pl.DataFrame: The DataFrame with an additional column for team logo URLs.
+        pl.DataFrame: The DataFrame with the team logo URLs as first column.
     """
-    return df.with_columns(
-        pl.col("team")
-        .map_elements(lambda x: get_team_logo_url(x), return_dtype=pl.String)
-        .alias("team_logo_url"),
-    )
+    return df.select(team_logo_url_expr("team").alias("team_logo_url"), pl.all())
@@ -5,7 +5,7 @@ Functions for retrieving data from the database for the Streamlit app.
 
 import polars as pl
 from psycopg2.extensions import connection
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 
 def get_teams_boxscore(conn: connection, game_id: str) -> pl.DataFrame:
@@ -163,18 +163,19 @@ def get_player_season_stats(
             AVG(pb.stl) as spg,
             AVG(pb.blk) as bpg,
             AVG(pb.tov) as tpg,
+            ROUND(AVG(pb.ast) / NULLIF(AVG(pb.tov), 0), 2)::float as ast_to_ratio,
             AVG(pb.fg) as fg,
             AVG(pb.fga) as fga,
-            SUM(pb.fg)::float / NULLIF(SUM(pb.fga), 0) as fg_pct,
+            ROUND(100 * SUM(pb.fg)::numeric / NULLIF(SUM(pb.fga), 0), 1)::float as fg_pct,
             AVG(pb.three_p) as three_p,
             AVG(pb.three_pa) as three_pa,
-            SUM(pb.three_p)::float / NULLIF(SUM(pb.three_pa), 0) as three_p_pct,
+            ROUND(100 * SUM(pb.three_p)::numeric / NULLIF(SUM(pb.three_pa), 0), 1)::float as three_p_pct,
             AVG(pb.two_p) as two_ppg,
             AVG(pb.two_pa) as two_papg,
-            SUM(pb.two_p)::float / NULLIF(SUM(pb.two_pa), 0) as two_p_pct,
+            ROUND(100 * SUM(pb.two_p)::numeric / NULLIF(SUM(pb.two_pa), 0), 1)::float as two_p_pct,
             AVG(pb.ft) as ft,
             AVG(pb.fta) as fta,
-            SUM(pb.ft)::float / NULLIF(SUM(pb.fta), 0) as ft_pct
+            ROUND(100 * SUM(pb.ft)::numeric / NULLIF(SUM(pb.fta), 0), 1)::float as ft_pct
         FROM 
             players_clean_seconds AS pb
         JOIN 
@@ -202,11 +203,61 @@ def get_player_season_stats(
     return df
 
 
+def build_team_stats_conditions(
+    team_abbreviation: str, filters: Dict[str, Any] = None
+) -> Tuple[List[str], List[Any]]:
+    """
+    Build the WHERE conditions and parameters of the team stats queries.
+
+    Args:
+        team_abbreviation: Abbreviation of the team
+        filters: Optional season, game_type and opponent filters
+
+    Returns:
+        Tuple with the SQL conditions and their query parameters
+    """
+    conditions = ["tb.team = %s"]
+    params = [team_abbreviation]
+
+    if filters:
+        if filters.get("season", "All Seasons") != "All Seasons":
+            conditions.append("s.season = %s")
+            params.append(filters["season"])
+
+        game_type = filters.get("game_type", "all")
+        if game_type == "regular season":
+            conditions.append(
+                "LOWER(s.game_type) IN ('regular season', 'in-season tournament') AND (LOWER(s.game_remarks) != 'championship game' OR s.game_remarks IS NULL)"
+            )
+        elif game_type != "all":
+            conditions.append("LOWER(s.game_type) = %s")
+            params.append(game_type)
+
+        if filters.get("opponent", "All Teams") != "All Teams":
+            conditions.append("tb.opponent = %s")
+            params.append(filters["opponent"])
+
+    return conditions, params
+
+
 # Function to get team stats for all games
-def get_team_stats(conn, team_abbreviation):
+def get_team_stats(
+    conn: connection, team_abbreviation: str, filters: Dict[str, Any] = None
+) -> pl.DataFrame:
     """
     Get team statistics across all games.
+
+    Args:
+        conn: Database connection
+        team_abbreviation: Abbreviation of the team
+        filters: Optional season, game_type and opponent filters, applied in the
+            query so that only matching games are returned
+
+    Returns:
+        DataFrame with one row per game played by the team
     """
+    conditions, params = build_team_stats_conditions(team_abbreviation, filters)
+
     query = f"""
     SELECT tb.*, 
             (tb.fg - tb.three_p) as two_p,
@@ -219,10 +270,58 @@ def get_team_stats(conn, team_abbreviation):
             s.home_team_pts, s.away_team_pts, s.game_type, s.game_remarks
     FROM public.teams_boxscore tb
     JOIN public.schedule s ON tb.game_id = s.id
-    WHERE tb.team = '{team_abbreviation}'
+    WHERE {" AND ".join(conditions)}
     ORDER BY s.date DESC
     """
-    return pl.read_database(query=query, connection=conn)
+    return pl.read_database(
+        query=query, connection=conn, execute_options={"vars": params}
+    )
+
+
+def get_team_season_aggregates(
+    conn: connection, team_abbreviation: str, filters: Dict[str, Any] = None
+) -> pl.DataFrame:
+    """
+    Get the per-season averages and record of a team, aggregated in the database.
+
+    Args:
+        conn: Database connection
+        team_abbreviation: Abbreviation of the team
+        filters: Optional season, game_type and opponent filters
+
+    Returns:
+        DataFrame with one row per season, sorted by season
+    """
+    conditions, params = build_team_stats_conditions(team_abbreviation, filters)
+
+    query = f"""
+    SELECT
+        s.season,
+        tb.team,
+        COUNT(*) as games_played,
+        ROUND(AVG(CAST(tb.pts AS float))::numeric, 1)::float as ppg,
+        ROUND(AVG(CAST(tb.ast AS float))::numeric, 1)::float as apg,
+        ROUND(AVG(CAST(tb.trb AS float))::numeric, 1)::float as rpg,
+        ROUND(AVG(CAST(tb.orb AS float))::numeric, 1)::float as orpg,
+        ROUND(AVG(CAST(tb.drb AS float))::numeric, 1)::float as drpg,
+        ROUND(AVG(CAST(tb.stl AS float))::numeric, 1)::float as spg,
+        ROUND(AVG(CAST(tb.blk AS float))::numeric, 1)::float as bpg,
+        ROUND(100 * AVG(CAST(tb.fg AS float)/NULLIF(CAST(tb.fga AS float), 0))::numeric, 1)::float as fg_pct,
+        ROUND(100 * AVG(CAST(tb.three_p AS float)/NULLIF(CAST(tb.three_pa AS float), 0))::numeric, 1)::float as three_p_pct,
+        ROUND(AVG(CAST(tb.three_pa AS float))::numeric, 1)::float as three_pa,
+        SUM(CASE WHEN CAST(tb.outcome AS integer) = 1 THEN 1 ELSE 0 END) as wins,
+        SUM(CASE WHEN CAST(tb.outcome AS integer) = 0 THEN 1 ELSE 0 END) as losses
+    FROM public.teams_boxscore tb
+    JOIN public.schedule s ON tb.game_id = s.id
+    WHERE {" AND ".join(conditions)}
+    GROUP BY s.season, tb.team
+    ORDER BY s.season
+    """
+    return pl.read_database(
+        query=query, connection=conn, execute_options={"vars": params}
+    ).with_columns(
+        (pl.col("wins") / (pl.col("wins") + pl.col("losses"))).alias("win_percentage")
+    )
 
 
 def get_team_season_stats(
@@ -257,16 +356,16 @@ def get_team_season_stats(
             SUM(CASE WHEN CAST(tb.outcome AS integer) = 0 THEN 1 ELSE 0 END) as losses,
             AVG(CAST(tb.fg AS float)) as fg,
             AVG(CAST(tb.fga AS float)) as fga,
-            AVG(CAST(tb.fg AS float)/NULLIF(CAST(tb.fga AS float), 0)) as fg_pct,
+            ROUND(100 * AVG(CAST(tb.fg AS float)/NULLIF(CAST(tb.fga AS float), 0))::numeric, 1)::float as fg_pct,
             AVG(CAST(tb.three_p AS float)) as three_p,
             AVG(CAST(tb.three_pa AS float)) as three_pa,
-            AVG(CAST(tb.three_p AS float)/NULLIF(CAST(tb.three_pa AS float), 0)) as three_p_pct,
+            ROUND(100 * AVG(CAST(tb.three_p AS float)/NULLIF(CAST(tb.three_pa AS float), 0))::numeric, 1)::float as three_p_pct,
             AVG(CAST(tb.ft AS float)) as ft,
             AVG(CAST(tb.fta AS float)) as fta,
-            AVG(CAST(tb.ft AS float)/NULLIF(CAST(tb.fta AS float), 0)) as ft_pct,
+            ROUND(100 * AVG(CAST(tb.ft AS float)/NULLIF(CAST(tb.fta AS float), 0))::numeric, 1)::float as ft_pct,
             AVG(CAST((tb.fg - tb.three_p) AS float)) as two_ppg,
             AVG(CAST((tb.fga - tb.three_pa) AS float)) as two_papg,
-            AVG(CAST((tb.fg - tb.three_p) AS float)/NULLIF(CAST((tb.fga - tb.three_pa) AS float), 0)) as two_p_pct,
+            ROUND(100 * AVG(CAST((tb.fg - tb.three_p) AS float)/NULLIF(CAST((tb.fga - tb.three_pa) AS float), 0))::numeric, 1)::float as two_p_pct,
             AVG(CAST(tb.pts AS float)) as ppg,
             AVG(CAST(tb2.pts AS float)) as points_allowed,
             AVG(CAST(tb.trb AS float)) as rpg,
@@ -275,7 +374,8 @@ def get_team_season_stats(
             AVG(CAST(tb.tov AS float)) as tpg,
             AVG(CAST(tb.ast AS float)) as apg,
             AVG(CAST(tb.stl AS float)) as spg,
-            AVG(CAST(tb.blk AS float)) as bpg
+            AVG(CAST(tb.blk AS float)) as bpg,
+            ROUND((AVG(CAST(tb.ast AS float)) / NULLIF(AVG(CAST(tb.tov AS float)), 0))::numeric, 2)::float as ast_to_ratio
         FROM public.teams_boxscore tb
         JOIN (SELECT game_id, team, opponent, pts FROM public.teams_boxscore) AS tb2 
             ON tb.game_id = tb2.game_id AND (tb.opponent = tb2.team AND tb.team != tb2.team)
@@ -340,55 +440,47 @@ def get_game_schedule(conn: connection, filters: Dict[str, Any] = None) -> pl.Da
     return pl.read_database(query=query, connection=conn, infer_schema_length=None)
 
 
-def get_teams_list(conn: connection) -> List[Dict[str, Any]]:
+def get_reference_lists(conn: connection) -> Tuple[List[Dict[str, Any]], List[str]]:
     """
-    Get list of all teams.
+    Get the list of all teams and the list of all seasons in one query.
 
     Args:
         conn: Database connection
 
     Returns:
-        List of team dictionaries
-    """
-    query = "SELECT * FROM public.teams ORDER BY name"
-    df = pl.read_database(query=query, connection=conn)
-
-    if df.is_empty():
-        return []
-
-    return df.rows(named=True)
-
-
-def get_seasons_list(conn: connection) -> List[str]:
+        Tuple with the list of team dictionaries and the list of season strings
     """
-    Get list of all seasons available in the database.
-
-    Args:
-        conn: Database connection
-
-    Returns:
-        List of season strings
+    # Both lists are aggregated to JSON so they come back as a single row
+    query = """
+    SELECT
+        (SELECT json_agg(t ORDER BY t.name) FROM public.teams t) AS teams,
+        (SELECT json_agg(s.season ORDER BY s.season DESC)
+         FROM (SELECT DISTINCT season FROM public.schedule) s) AS seasons
     """
-    query = "SELECT DISTINCT season FROM public.schedule ORDER BY season DESC"
-    df = pl.read_database(query=query, connection=conn)
-
-    if df.is_empty():
-        return []
+    teams, seasons = pl.read_database(query=query, connection=conn).row(0)
 
-    return df["season"].to_list()
+    return teams or [], seasons or []
 
 
 def get_season_stats(
-    conn: connection, season: str, stat_type: str, game_type: str
+    conn: connection,
+    season: str,
+    stat_type: str,
+    game_type: str,
+    min_games: Optional[int] = None,
 ) -> pl.DataFrame:
     """
     Get season statistics for teams or players.
 
+    Percentages are returned on a 0-100 scale rounded to one decimal, along with
+    the assist to turnover ratio.
+
     Args:
         conn: Database connection
         season: Season to filter by (e.g., "2023-2024")
         stat_type: Type of statistics to retrieve ("team" or "player")
         game_type: Type of game (e.g., "regular season", "playoffs", "all")
+        min_games: Minimum games played to be included (for player stats)
 
     Returns:
         DataFrame with season statistics
@@ -396,7 +488,9 @@ def get_season_stats(
     if stat_type == "team":
         return get_team_season_stats(conn, season=season, game_type=game_type)
     elif stat_type == "player":
-        return get_player_season_stats(conn, season=season, game_type=game_type)
+        return get_player_season_stats(
+            conn, season=season, min_games=min_games, game_type=game_type
+        )
     else:
         raise ValueError("Invalid stat type. Must be 'team' or 'player'.")
 
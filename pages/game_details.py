@@ -37,11 +37,11 @@ else:
 
 # Get team abbreviations
 home_team_abbr = get_abbreviation(
-    teams=st.session_state["teams"],
+    team_name_to_abbr=st.session_state["team_name_to_abbr"],
     team_name=home_team_name.upper(),
 )
 away_team_abbr = get_abbreviation(
-    teams=st.session_state["teams"],
+    team_name_to_abbr=st.session_state["team_name_to_abbr"],
     team_name=away_team_name.upper(),
 )
 
@@ -49,20 +49,14 @@ away_team_abbr = get_abbreviation(
 page_header("Game Details")
 team_matchup_header(home_team_name, away_team_name)
 
-# Initialize connection and get data
-conn = get_connection()
+# Get teams and players boxscore data
+with get_connection() as conn:
+    teams_data = get_teams_boxscore(conn, game_id)
+    players_data_raw = get_players_boxscore(conn, game_id)
 
-# Get teams boxscore data
-teams_data = get_teams_boxscore(conn, game_id)
 teams_display_data = prepare_teams_boxscore(teams_data, TEAMS_STATS_COLUMNS)
-
-# Get players boxscore data
-players_data_raw = get_players_boxscore(conn, game_id)
 players_display_data = prepare_players_boxscore(players_data_raw, PLAYERS_STATS_COLUMNS)
 
-# Close connection
-conn.close()
-
 # Display team stats
 st.header("Team Stats")
 team_stats_table(
@@ -79,7 +73,8 @@ if selected_rows:
     selected_game = teams_display_data.row(selected_rows[0], named=True)
     if selected_game["team"]:
         team_name = get_team_name_by_abbreviation(
-            teams=st.session_state["teams"], abbreviation=selected_game["team"]
+            team_abbr_to_name=st.session_state["team_abbr_to_name"],
+            abbreviation=selected_game["team"],
         )
         # Set the selected team in session state
         AppState.set_selected_team(team_name=team_name)
@@ -9,18 +9,14 @@ import json
 from datetime import datetime
 from pathlib import Path
 
-from utils.connection import get_connection
+from utils.app_state import AppState
 from utils.teams import get_team_logo_url, get_abbreviation
-from data.queries import get_teams_list
 
 # Set page config
 # st.set_page_config(layout="wide")
 
-# Initialize session state for teams if not exists
-if "teams" not in st.session_state:
-    conn = get_connection()
-    st.session_state["teams"] = get_teams_list(conn)
-    conn.close()
+# Initialize core state (teams and their lookups)
+AppState.initialize_core_state()
 
 # Page title
 st.title("Game Predictions")
@@ -159,7 +155,7 @@ else:
             home_team = game["teams"]["home"]
             away_team = game["teams"]["away"]
             winning_team_abbreviation = get_abbreviation(
-                teams=st.session_state["teams"],
+                team_name_to_abbr=st.session_state["team_name_to_abbr"],
                 team_name=game["prediction"]["winner_name"],
             )
 
@@ -4,6 +4,7 @@ Displays a list of NBA games with filtering options.
 """
 
 import streamlit as st
+import polars as pl
 
 from utils.connection import get_connection
 from data.queries import get_game_schedule
@@ -13,6 +14,24 @@ from components.filters import filters_sidebar
 from utils.game_processing import prepare_game_result_data
 from components.game_cards import games_calendar_view, games_table_view
 
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_games(filters: dict) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """
+    Fetch the games matching the filters and group them by date, cached per filters.
+
+    Args:
+        filters: Game filters from the sidebar
+
+    Returns:
+        Tuple of (games_df, dates_df) as returned by prepare_game_result_data
+    """
+    with get_connection() as conn:
+        games = get_game_schedule(conn, filters)
+
+    return prepare_game_result_data(games, group_by_date=True, sort_desc=True)
+
+
 # Initialize core state (teams, seasons)
 AppState.initialize_core_state()
 
@@ -40,20 +59,13 @@ if st.session_state.get("seasons"):
     if "season" in filters:
         season_year = int(filters["season"].split("-")[0])
 
-# Get data
-conn = get_connection()
-games = get_game_schedule(conn, filters)
-conn.close()
+# Get data, grouped by date
+games_data, dates_data = load_games(filters)
 
 # Display games
-if games.is_empty():
+if games_data.is_empty():
     st.info("No games found matching your filters.")
 else:
-    # Process games data
-    games_data, dates_data = prepare_game_result_data(
-        games, group_by_date=True, sort_desc=True
-    )
-
     # Create tabs for different views
     tab1, tab2 = st.tabs(["Calendar View", "Table View"])
     with tab1:
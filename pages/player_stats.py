@@ -40,9 +40,30 @@ from components.charts import (
     player_shot_chart,
     location_bar_chart,
 )
-from components.layout import tabbed_interface, two_column_layout
+from components.layout import metrics_row, tabbed_interface, two_column_layout
 from components.game_cards import totals_card, highs_card
 
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_player_data(player_name: str) -> pl.DataFrame | None:
+    """
+    Fetch and prepare all games of a player, cached per searched name.
+
+    Args:
+        player_name: Player name to search for
+
+    Returns:
+        Prepared player data, or None if no games were found
+    """
+    with get_connection() as conn:
+        player_data_raw = get_player_stats(conn, player_name)
+
+    if player_data_raw.is_empty():
+        return None
+
+    return prepare_player_data(player_data_raw)
+
+
 # Initialize core state (teams, seasons)
 AppState.initialize_core_state()
 
@@ -59,17 +80,12 @@ if selected_player:
 
 # Search for player if name is provided
 if player_name:
-    # Get player data
-    conn = get_connection()
-    player_data_raw = get_player_stats(conn, player_name)
-    conn.close()
+    # Get processed player data
+    player_data = load_player_data(player_name)
 
-    if not player_data_raw.is_empty():
+    if player_data is not None:
         # Update player name with exact match from database
-        player_name = player_data_raw[0, "player_name"]
-
-        # Process player data
-        player_data = prepare_player_data(player_data_raw)
+        player_name = player_data[0, "player_name"]
 
         # Get unique opponents for filter
         unique_opponents = (
@@ -90,7 +106,7 @@ if player_name:
         player_header(
             name=player_name,
             player_id=st.session_state.get("selected_player_id")
-            or player_data_raw.item(0, "nba_player_id"),
+            or player_data.item(0, "nba_player_id"),
         )
 
         # Sidebar filters
@@ -140,27 +156,23 @@ if player_name:
                 st.info("No data available for the selected filters.")
                 return
             # Prepare career stats
-            career_stats, career_stats_mean, record = prepare_player_career_stats(
-                filtered_data_without_season
-            )
-            season_stats, season_stats_mean, record = prepare_player_career_stats(
-                filtered_data
+            career_stats, career_stats_mean = prepare_player_career_stats(
+                filtered_data_without_season, include_record=False
             )
+            _, season_stats_mean, record = prepare_player_career_stats(filtered_data)
 
             # Display career stats summary metrics
             if not career_stats.is_empty():
-                cols = st.columns(6)
-
-                with cols[0]:
-                    st.metric("PPG", f"{season_stats_mean.item(0, column='ppg'):.1f}")
-                with cols[1]:
-                    st.metric("RPG", f"{season_stats_mean[0, 'rpg']:.1f}")
-                with cols[2]:
-                    st.metric("APG", f"{season_stats_mean[0, 'apg']:.1f}")
-                with cols[3]:
-                    st.metric("FG%", f"{(season_stats_mean[0, 'fg_pct']):.1f}%")
-                with cols[5]:
-                    st.metric("Record", f"{record['wins']}-{record['losses']}")
+                season_means = season_stats_mean.row(0, named=True)
+                metrics_row(
+                    {
+                        "PPG": f"{season_means['ppg']:.1f}",
+                        "RPG": f"{season_means['rpg']:.1f}",
+                        "APG": f"{season_means['apg']:.1f}",
+                        "FG%": f"{season_means['fg_pct']:.1f}%",
+                        "Record": f"{record['wins']}-{record['losses']}",
+                    }
+                )
 
                 with st.expander("Season Stats", expanded=True):
                     stats_table(
@@ -293,9 +305,6 @@ if player_name:
 
                 # Shooting statistics chart
                 with st.expander("Shooting Statistics by Season", expanded=True):
-                    # Create season-by-season shooting stats
-                    shooting_data = get_shooting_stats(career_data)
-
                     # Selector for shooting stats to display
                     shooting_stats_options = [
                         "Field Goals",
@@ -310,6 +319,9 @@ if player_name:
                     )
 
                     if shooting_stats_selected:
+                        # Create season-by-season shooting stats
+                        shooting_data = get_shooting_stats(career_data)
+
                         fig_shooting = player_shot_chart(
                             shooting_data, shooting_stats_selected
                         )
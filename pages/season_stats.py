@@ -15,11 +15,119 @@ from data.column_config import (
 )
 from components.headers import page_header
 from components.filters import season_filter, game_type_filter
-from utils.data_processing import prepare_season_stats
 from components.tables import stats_table
 from components.charts import stat_bar_chart
 from components.layout import tabbed_interface
 
+# Leaderboard columns and whether higher values rank first
+LEADERBOARD_SORTS = {
+    "wins": True,
+    "ppg": True,
+    "rpg": True,
+    "apg": True,
+    "bpg": True,
+    "spg": True,
+    "points_allowed": False,
+}
+
+# Chart hover templates, customdata holds the chart's hover_data columns in order
+HOVER_TEMPLATES = {
+    "points_allowed": "<b>%{x}</b><br>Points Allowed: %{y:.1f}<br>GP: %{customdata[0]}<extra></extra>",
+    "blocks": "<b>%{x}</b><br>Blocks: %{y:.1f}<br>GP: %{customdata[0]}<extra></extra>",
+    "bpg": "<b>%{x}</b><br>BPG: %{y:.1f}<br>GP: %{customdata[0]}<extra></extra>",
+    "spg": "<b>%{x}</b><br>SPG: %{y:.1f}<br>GP: %{customdata[0]}<extra></extra>",
+    "defense_comparison": "<b>%{x}</b><br>%{fullData.name}: %{y:.1f}<br>GP: %{customdata[0]}<extra></extra>",
+    "shooting_comparison": "<b>%{x}</b><br>%{fullData.name}: %{y:.1f}%<br>GP: %{customdata[0]}<extra></extra>",
+    "fg_pct": "<b>%{x}</b><br>FG%: %{y:.1f}%<br>FGM: %{customdata[0]:.1f}<br>FGA: %{customdata[1]:.1f}<br>GP: %{customdata[2]}<extra></extra>",
+    "three_p_pct": "<b>%{x}</b><br>3P%: %{y:.1f}%<br>3PM: %{customdata[0]:.1f}<br>3PA: %{customdata[1]:.1f}<br>GP: %{customdata[2]}<extra></extra>",
+    "two_p_pct": "<b>%{x}</b><br>2P%: %{y:.1f}%<br>2PM: %{customdata[0]:.1f}<br>2PA: %{customdata[1]:.1f}<br>GP: %{customdata[2]}<extra></extra>",
+    "ft_pct": "<b>%{x}</b><br>FT%: %{y:.1f}%<br>FTM: %{customdata[0]:.1f}<br>FTA: %{customdata[1]:.1f}<br>GP: %{customdata[2]}<extra></extra>",
+}
+
+# Shooting leaderboards only rank entries with enough field goal attempts
+SHOOTING_SORTS = ["fg_pct", "three_p_pct", "two_p_pct", "ft_pct"]
+SHOOTING_MIN_FGA = 5
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_season_stats(
+    season: str, stat_type: str, game_type: str, min_games: int
+) -> pl.DataFrame | None:
+    """
+    Fetch the season stats for the given filters, cached per filter set.
+
+    Args:
+        season: Season to load (e.g., "2023-2024")
+        stat_type: "team" or "player"
+        game_type: Game type filter
+        min_games: Minimum games played (for player stats)
+
+    Returns:
+        Season stats DataFrame, or None if no rows match the filters
+    """
+    with get_connection() as conn:
+        season_data = get_season_stats(
+            conn, season, stat_type, game_type, min_games=min_games
+        )
+
+    if season_data.is_empty():
+        return None
+
+    if stat_type == "player":
+        # Blocks plus steals, used to rank the defensive comparison chart
+        season_data = season_data.with_columns(
+            (pl.col("bpg") + pl.col("spg")).alias("def_total")
+        )
+
+    return season_data
+
+
+@st.cache_data(show_spinner=False)
+def get_season_leaders(stats_data: pl.DataFrame) -> dict[str, pl.DataFrame]:
+    """
+    Sort the season stats once per leaderboard column shown in the tabs.
+
+    Shooting leaderboards are sorted from the rows meeting the minimum field goal
+    attempts, filtered once and shared by the four shooting columns.
+
+    Args:
+        stats_data: Season stats DataFrame
+
+    Returns:
+        Dictionary mapping each available leaderboard column to the sorted DataFrame
+    """
+    leaders = {
+        column: stats_data.sort(column, descending=descending, nulls_last=True)
+        for column, descending in LEADERBOARD_SORTS.items()
+        if column in stats_data.columns
+    }
+
+    shooting_data = stats_data.filter(pl.col("fga") >= SHOOTING_MIN_FGA)
+    leaders.update(
+        {
+            column: shooting_data.sort(column, descending=True, nulls_last=True)
+            for column in SHOOTING_SORTS
+        }
+    )
+
+    return leaders
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def load_season_champion(season: str) -> dict[str, str] | None:
+    """
+    Get the champion of a season, cached since it does not change once decided.
+
+    Args:
+        season: Season to look up (e.g., "2023-2024")
+
+    Returns:
+        Dictionary with the champion team name and abbreviation, or None
+    """
+    with get_connection() as conn:
+        return get_season_champion(conn, season)
+
+
 # Initialize core state (teams, seasons)
 AppState.initialize_core_state()
 
@@ -53,426 +161,398 @@ with st.sidebar:
         )
 
 # Get data
-conn = get_connection()
-season_data = get_season_stats(
-    conn, selected_season, selected_stat_type, selected_game_type
+stats_data = load_season_stats(
+    selected_season, selected_stat_type, selected_game_type, min_games
 )
 
-if not season_data.is_empty():
-    # Process season stats data
-    stats_data = prepare_season_stats(
-        season_data, stat_type=selected_stat_type, min_games=min_games
-    ).with_columns(
-        # Round all int and float columns to 3 decimal place
-        (pl.selectors.float()).round(4)
+# Stop before any processing when there is nothing to show
+if stats_data is None:
+    st.warning(
+        f"No data available for season {selected_season} with the selected filters."
     )
+    st.stop()
+
+# Sorted once per leaderboard column and shared by the tabs
+leaders = get_season_leaders(stats_data)
+
+# Determine which columns to show
+if selected_stat_type == "team":
+    column_config = TEAM_SEASON_STATS_COLUMN_CONFIG
+    sort_column = "wins"
+    group_name = "team"
+else:  # player stats
+    column_config = PLAYER_SEASON_STATS_COLUMN_CONFIG
+    sort_column = "ppg"
+    group_name = "player"
+
+
+# Define tab functions
+def show_overview():
+    # Message to inform the user about the sorting column
+    st.info(
+        f"Data is sorted by {sort_column} in descending order. Click on the column header to sort by a different column."
+    )
+    # Display overview table
+    stats_table(leaders[sort_column], column_config=column_config)
 
-    if stats_data.is_empty():
-        st.warning("No data available for the selected filters.")
-        st.stop()
-
-    # Determine which columns to show
+    # Add season champion
     if selected_stat_type == "team":
-        column_config = TEAM_SEASON_STATS_COLUMN_CONFIG
-        sort_column = "wins"
-        group_name = "team"
-    else:  # player stats
-        column_config = PLAYER_SEASON_STATS_COLUMN_CONFIG
-        sort_column = "ppg"
-        group_name = "player"
-
-    # Define tab functions
-    def show_overview():
-        # Message to inform the user about the sorting column
-        st.info(
-            f"Data is sorted by {sort_column} in descending order. Click on the column header to sort by a different column."
-        )
-        # Display overview table
-        sorted_data = stats_data.sort(sort_column, descending=True, nulls_last=True)
-        stats_table(sorted_data, column_config=column_config)
+        champion = load_season_champion(selected_season)
+        if champion:
+            st.success(f"NBA Champion: {champion['team_name']}", icon="🏆")
+        else:
+            st.warning("No NBA champion for this season yet.")
 
-        # Add season champion
-        if selected_stat_type == "team":
-            champion = get_season_champion(conn, selected_season)
-            if champion:
-                st.success(f"NBA Champion: {champion['team_name']}", icon="🏆")
-            else:
-                st.warning("No NBA champion for this season yet.")
-
-    def show_points():
-        # Display points leaders
-        points_data = stats_data.sort(
-            "ppg", descending=True, nulls_last=True
-        ).with_columns(pl.col("ppg").round(1).name.keep())
-        stats_table(points_data, column_config=column_config)
-
-        # Display chart
-        pts_fig = stat_bar_chart(
-            points_data.head(10),
-            x_col=group_name,
-            y_col="ppg",
-            title=f"Top 10 Scoring {selected_stat_type.title()} ({selected_season})",
-        )
-        st.plotly_chart(pts_fig, use_container_width=True)
-
-    def show_rebounds():
-        # Display rebound leaders with offensive and defensive rebounds breakdown
-        rebound_data = stats_data.sort(
-            "rpg", descending=True, nulls_last=True
-        ).with_columns(pl.col(["rpg", "orpg", "drpg"]).round(1).name.keep())
-        stats_table(rebound_data, column_config=column_config)
-
-        # Create columns for charts
-        col1, col2 = st.columns(2)
-
-        # Total rebounds chart
-        with col1:
-            rpg_fig = stat_bar_chart(
-                rebound_data.head(10),
-                x_col=group_name,
-                y_col="rpg",
-                title=f"Top 10 Total Rebounds ({selected_season})",
-                labels={"rpg": "Total Rebounds"},
-            )
-            st.plotly_chart(rpg_fig, use_container_width=True)
 
-        # Offensive vs Defensive rebounds comparison
-        with col2:
-            top10_rebounders = rebound_data.head(10)
-            orpg_drpg_fig = stat_bar_chart(
-                top10_rebounders,
-                x_col=group_name,
-                y_col=["orpg", "drpg"],
-                title=f"ORB vs DRB Breakdown ({selected_season})",
-                stack=True,
-                labels={"orpg": "Offensive", "drpg": "Defensive"},
-                colors=["#FF9B54", "#5DADE2"],
-            )
-            st.plotly_chart(orpg_drpg_fig, use_container_width=True)
+def show_points():
+    # Display points leaders
+    # Rounding keeps the order but clears the sorted flag, so restore it
+    points_data = (
+        leaders["ppg"]
+        .with_columns(pl.col("ppg").round(1).name.keep())
+        .set_sorted("ppg", descending=True)
+    )
+    stats_table(points_data, column_config=column_config)
+
+    # Display chart
+    pts_fig = stat_bar_chart(
+        points_data.head(10),
+        x_col=group_name,
+        y_col="ppg",
+        title=f"Top 10 Scoring {selected_stat_type.title()} ({selected_season})",
+    )
+    st.plotly_chart(pts_fig, use_container_width=True)
 
-        # Add explanation
-        st.info(
-            "Rebounding comparison shows both total rebounds (RPG) and the breakdown between offensive (ORPG) and defensive (DRPG) rebounds."
-        )
 
-    def show_assists():
-        # Calculate assist to turnover ratio
-        assist_data = (
-            stats_data.with_columns(
-                [
-                    pl.col("apg").cast(pl.Float64).name.keep(),
-                    pl.col("tpg").cast(pl.Float64).name.keep(),
-                ]
-            )
-            .with_columns(
-                (pl.col("apg") / pl.col("tpg")).round(2).alias("ast_to_ratio"),
-            )
-            .sort("apg", descending=True, nulls_last=True)
+def show_rebounds():
+    # Display rebound leaders with offensive and defensive rebounds breakdown
+    rebound_data = (
+        leaders["rpg"]
+        .with_columns(pl.col(["rpg", "orpg", "drpg"]).round(1).name.keep())
+        .set_sorted("rpg", descending=True)
+    )
+    stats_table(rebound_data, column_config=column_config)
+
+    # Create columns for charts
+    col1, col2 = st.columns(2)
+
+    # Total rebounds chart
+    with col1:
+        rpg_fig = stat_bar_chart(
+            rebound_data.head(10),
+            x_col=group_name,
+            y_col="rpg",
+            title=f"Top 10 Total Rebounds ({selected_season})",
+            labels={"rpg": "Total Rebounds"},
         )
+        st.plotly_chart(rpg_fig, use_container_width=True)
 
-        # Add assist-to-turnover ratio to column config
-        extended_column_config = column_config.copy()
-        extended_column_config["ast_to_ratio"] = st.column_config.NumberColumn(
-            "AST/TO", format="%.2f", help="Assist to Turnover Ratio", width="small"
+    # Offensive vs Defensive rebounds comparison
+    with col2:
+        top10_rebounders = rebound_data.head(10)
+        orpg_drpg_fig = stat_bar_chart(
+            top10_rebounders,
+            x_col=group_name,
+            y_col=["orpg", "drpg"],
+            title=f"ORB vs DRB Breakdown ({selected_season})",
+            stack=True,
+            labels={"orpg": "Offensive", "drpg": "Defensive"},
+            colors=["#FF9B54", "#5DADE2"],
         )
+        st.plotly_chart(orpg_drpg_fig, use_container_width=True)
 
-        # Display assist leaders with AST/TO ratio
-        stats_table(assist_data, column_config=extended_column_config)
+    # Add explanation
+    st.info(
+        "Rebounding comparison shows both total rebounds (RPG) and the breakdown between offensive (ORPG) and defensive (DRPG) rebounds."
+    )
 
-        # Create columns for charts
-        col1, col2 = st.columns(2)
 
-        # Assists chart
-        with col1:
-            apg_fig = stat_bar_chart(
-                assist_data.head(10),
-                x_col=group_name,
-                y_col="apg",
-                title=f"Top 10 Assists Per Game ({selected_season})",
-            )
-            st.plotly_chart(apg_fig, use_container_width=True)
-
-        # AST/TO ratio chart
-        with col2:
-            ratio_data = (
-                assist_data.filter(pl.col("games_played") >= 10)
-                .sort("ast_to_ratio", descending=True)
-                .head(10)
-            )
-            ratio_fig = stat_bar_chart(
-                ratio_data,
-                x_col=group_name,
-                y_col="ast_to_ratio",
-                title=f"Top 10 AST/TO Ratio ({selected_season})",
-                colors=["#27AE60"],
-            )
-            st.plotly_chart(ratio_fig, use_container_width=True)
+def show_assists():
+    # Assist leaders, with the AST/TO ratio computed by the query
+    assist_data = leaders["apg"]
+
+    # Display assist leaders with AST/TO ratio
+    stats_table(assist_data, column_config=column_config)
+
+    # Create columns for charts
+    col1, col2 = st.columns(2)
 
-        # Comparison chart - assists vs turnovers
-        ast_tov_data = assist_data.head(10)
-        ast_tov_fig = stat_bar_chart(
-            ast_tov_data,
+    # Assists chart
+    with col1:
+        apg_fig = stat_bar_chart(
+            assist_data.head(10),
             x_col=group_name,
-            y_col=["apg", "tpg"],
-            title=f"Assists vs Turnovers ({selected_season})",
-            stack=False,
-            labels={"apg": "Assists", "tpg": "Turnovers"},
-            colors=["#27AE60", "#E74C3C"],
+            y_col="apg",
+            title=f"Top 10 Assists Per Game ({selected_season})",
+        )
+        st.plotly_chart(apg_fig, use_container_width=True)
+
+    # AST/TO ratio chart
+    with col2:
+        # top_k does not keep the rows ordered, so sort the 10 selected ones
+        ratio_data = (
+            assist_data.filter(pl.col("games_played") >= 10)
+            .top_k(10, by="ast_to_ratio")
+            .sort("ast_to_ratio", descending=True)
+        )
+        ratio_fig = stat_bar_chart(
+            ratio_data,
+            x_col=group_name,
+            y_col="ast_to_ratio",
+            title=f"Top 10 AST/TO Ratio ({selected_season})",
+            colors=["#27AE60"],
         )
-        st.plotly_chart(ast_tov_fig, use_container_width=True)
+        st.plotly_chart(ratio_fig, use_container_width=True)
+
+    # Comparison chart - assists vs turnovers
+    ast_tov_data = assist_data.head(10)
+    ast_tov_fig = stat_bar_chart(
+        ast_tov_data,
+        x_col=group_name,
+        y_col=["apg", "tpg"],
+        title=f"Assists vs Turnovers ({selected_season})",
+        stack=False,
+        labels={"apg": "Assists", "tpg": "Turnovers"},
+        colors=["#27AE60", "#E74C3C"],
+    )
+    st.plotly_chart(ast_tov_fig, use_container_width=True)
 
-        # Add explanation
-        st.info(
-            "Assist to Turnover Ratio (AST/TO) measures playmaking efficiency. A higher ratio indicates better ball distribution with fewer mistakes."
+    # Add explanation
+    st.info(
+        "Assist to Turnover Ratio (AST/TO) measures playmaking efficiency. A higher ratio indicates better ball distribution with fewer mistakes."
+    )
+
+
+def show_defense():
+    # Set up sorting for defensive metrics based on stat type
+    if selected_stat_type == "team":
+        # For teams, sort by points allowed (ascending)
+        defense_data = leaders["points_allowed"]
+        defense_metric = "points_allowed"
+        defense_title = "Points Allowed Per Game"
+        defense_color = "#8E44AD"  # Purple
+        defense_hover = HOVER_TEMPLATES["points_allowed"]
+    else:
+        # For players, sort by blocks (descending)
+        defense_data = leaders["bpg"]
+        defense_metric = "bpg"
+        defense_title = "Blocks Per Game"
+        defense_color = "#2471A3"  # Blue
+        defense_hover = HOVER_TEMPLATES["blocks"]
+
+    # Display defense leaders table
+    st.subheader(f"Defense Leaders - {selected_season}")
+    stats_table(defense_data, column_config=column_config)
+
+    # Create columns for charts
+    col1, col2 = st.columns(2)
+
+    # Primary defensive metric chart (points allowed or blocks)
+    with col1:
+        defense_fig = stat_bar_chart(
+            defense_data.head(10),
+            x_col=group_name,
+            y_col=defense_metric,
+            title=f"Top 10 {defense_title} ({selected_season})",
+            colors=[defense_color],
+            custom_hovertemplate=defense_hover,
+            hover_data=["games_played"],
         )
+        st.plotly_chart(defense_fig, use_container_width=True)
 
-    def show_defense():
-        # Set up sorting for defensive metrics based on stat type
+    # Blocks chart (if showing team data, otherwise show steals)
+    with col2:
         if selected_stat_type == "team":
-            # For teams, sort by points allowed (ascending)
-            defense_data = stats_data.sort("points_allowed", nulls_last=True)
-            defense_metric = "points_allowed"
-            defense_title = "Points Allowed Per Game"
-            defense_color = "#8E44AD"  # Purple
-            defense_label = "Points Allowed"
-        else:
-            # For players, sort by blocks (descending)
-            defense_data = stats_data.sort("bpg", descending=True)
-            defense_metric = "bpg"
-            defense_title = "Blocks Per Game"
-            defense_color = "#2471A3"  # Blue
-            defense_label = "Blocks"
-
-        # Display defense leaders table
-        st.subheader(f"Defense Leaders - {selected_season}")
-        stats_table(defense_data, column_config=column_config)
-
-        # Create columns for charts
-        col1, col2 = st.columns(2)
-
-        # Primary defensive metric chart (points allowed or blocks)
-        with col1:
-            defense_fig = stat_bar_chart(
-                defense_data.head(10),
+            # For teams, show blocks
+            block_data = leaders["bpg"].head(10)
+            block_fig = stat_bar_chart(
+                block_data,
                 x_col=group_name,
-                y_col=defense_metric,
-                title=f"Top 10 {defense_title} ({selected_season})",
-                colors=[defense_color],
-                custom_hovertemplate=f"<b>%{{x}}</b><br>{defense_label}: %{{y:.1f}}<br>GP: %{{customdata[0]}}<extra></extra>",
+                y_col="bpg",
+                title=f"Top 10 Blocking Teams ({selected_season})",
+                colors=["#148F77"],  # Teal
+                custom_hovertemplate=HOVER_TEMPLATES["bpg"],
                 hover_data=["games_played"],
             )
-            st.plotly_chart(defense_fig, use_container_width=True)
-
-        # Blocks chart (if showing team data, otherwise show steals)
-        with col2:
-            if selected_stat_type == "team":
-                # For teams, show blocks
-                block_data = stats_data.sort("bpg", descending=True).head(10)
-                block_fig = stat_bar_chart(
-                    block_data,
-                    x_col=group_name,
-                    y_col="bpg",
-                    title=f"Top 10 Blocking Teams ({selected_season})",
-                    colors=["#148F77"],  # Teal
-                    custom_hovertemplate="<b>%{x}</b><br>BPG: %{y:.1f}<br>GP: %{customdata[0]}<extra></extra>",
-                    hover_data=["games_played"],
-                )
-                st.plotly_chart(block_fig, use_container_width=True)
-            else:
-                # For players, show steals
-                steal_data = stats_data.sort("spg", descending=True).head(10)
-                steal_fig = stat_bar_chart(
-                    steal_data,
-                    x_col=group_name,
-                    y_col="spg",
-                    title=f"Top 10 Steals Leaders ({selected_season})",
-                    colors=["#D35400"],  # Orange
-                    custom_hovertemplate="<b>%{x}</b><br>SPG: %{y:.1f}<br>GP: %{customdata[0]}<extra></extra>",
-                    hover_data=["games_played"],
-                )
-                st.plotly_chart(steal_fig, use_container_width=True)
-
-        # Defensive comparison chart
-        if selected_stat_type == "players":
-            # For players, compare blocks vs steals
-            st.subheader("Defensive Stats Comparison")
-            top_defenders = stats_data.sort(
-                pl.col("bpg") + pl.col("spg"), descending=True
-            ).head(10)
-            defense_compare_fig = stat_bar_chart(
-                top_defenders,
+            st.plotly_chart(block_fig, use_container_width=True)
+        else:
+            # For players, show steals
+            steal_data = leaders["spg"].head(10)
+            steal_fig = stat_bar_chart(
+                steal_data,
                 x_col=group_name,
-                y_col=["bpg", "spg"],
-                title=f"Blocks vs Steals ({selected_season})",
-                stack=False,
-                labels={"bpg": "Blocks Per Game", "spg": "Steals Per Game"},
-                colors=["#2471A3", "#D35400"],
-                custom_hovertemplate="<b>%{x}</b><br>%{fullData.name}: %{y:.1f}<br>GP: %{customdata[0]}<extra></extra>",
+                y_col="spg",
+                title=f"Top 10 Steals Leaders ({selected_season})",
+                colors=["#D35400"],  # Orange
+                custom_hovertemplate=HOVER_TEMPLATES["spg"],
                 hover_data=["games_played"],
             )
-            st.plotly_chart(defense_compare_fig, use_container_width=True)
+            st.plotly_chart(steal_fig, use_container_width=True)
 
-        # Add explanation
-        if selected_stat_type == "team":
-            st.info(
-                "Teams with lower points allowed per game typically have stronger defenses. "
-                "Blocks can indicate rim protection ability, another key aspect of team defense."
-            )
-        else:
-            st.info(
-                "Blocks and steals are key defensive statistics for individual players. "
-                "Elite defenders typically excel in one or both categories."
-            )
+    # Defensive comparison chart
+    if selected_stat_type == "player":
+        # For players, compare blocks vs steals
+        st.subheader("Defensive Stats Comparison")
+        top_defenders = stats_data.top_k(10, by="def_total").sort(
+            "def_total", descending=True
+        )
+        defense_compare_fig = stat_bar_chart(
+            top_defenders,
+            x_col=group_name,
+            y_col=["bpg", "spg"],
+            title=f"Blocks vs Steals ({selected_season})",
+            stack=False,
+            labels={"bpg": "Blocks Per Game", "spg": "Steals Per Game"},
+            colors=["#2471A3", "#D35400"],
+            custom_hovertemplate=HOVER_TEMPLATES["defense_comparison"],
+            hover_data=["games_played"],
+        )
+        st.plotly_chart(defense_compare_fig, use_container_width=True)
 
-    def show_shooting():
-        def multi_shooting_comparison(shooting_column: str):
-            # Multi-shooting comparison chart
-            st.subheader("Shooting Efficiency Comparison")
-            top_shooters = shooting_data.sort(
-                shooting_column, descending=True, nulls_last=True
-            ).head(8)
-
-            # For the multi-metric chart, create a comprehensive hover template
-            multi_hover_template = (
-                "<b>%{x}</b><br>"
-                + "%{fullData.name}: %{y:.1f}%<br>"
-                + "GP: "
-                + top_shooters["games_played"].cast(pl.Utf8)[0]
-                + "<extra></extra>"
-            )
+    # Add explanation
+    if selected_stat_type == "team":
+        st.info(
+            "Teams with lower points allowed per game typically have stronger defenses. "
+            "Blocks can indicate rim protection ability, another key aspect of team defense."
+        )
+    else:
+        st.info(
+            "Blocks and steals are key defensive statistics for individual players. "
+            "Elite defenders typically excel in one or both categories."
+        )
 
-            shooting_comparison = stat_bar_chart(
-                top_shooters,
-                x_col=group_name,
-                y_col=[
-                    "fg_pct",
-                    "three_p_pct",
-                    "two_p_pct",
-                    "ft_pct",
-                ],
-                title=f"Shooting Efficiency Breakdown ({selected_season})",
-                stack=False,
-                labels={
-                    "fg_pct": "FG%",
-                    "three_p_pct": "3P%",
-                    "two_p_pct": "2P%",
-                    "ft_pct": "FT%",
-                },
-                colors=["#4A235A", "#1A5276", "#117A65", "#D35400"],
-                hover_data=["games_played"],
-                custom_hovertemplate=multi_hover_template,
-            )
-            return st.plotly_chart(shooting_comparison, use_container_width=True)
 
-        # Compare different shooting stats (FG%, 3PT%, 2PT%, FT%)
-        shooting_data = stats_data.filter(pl.col("fga") >= 5)
+def show_shooting():
+    def multi_shooting_comparison(sorted_shooting_data: pl.DataFrame):
+        # Multi-shooting comparison chart
+        st.subheader("Shooting Efficiency Comparison")
+        top_shooters = sorted_shooting_data.head(8)
 
-        # Create tabs for different shooting metrics
-        shooting_tabs = st.tabs(
-            ["Field Goal %", "Three-Point %", "Two-Point %", "Free Throw %"]
+        shooting_comparison = stat_bar_chart(
+            top_shooters,
+            x_col=group_name,
+            y_col=[
+                "fg_pct",
+                "three_p_pct",
+                "two_p_pct",
+                "ft_pct",
+            ],
+            title=f"Shooting Efficiency Breakdown ({selected_season})",
+            stack=False,
+            labels={
+                "fg_pct": "FG%",
+                "three_p_pct": "3P%",
+                "two_p_pct": "2P%",
+                "ft_pct": "FT%",
+            },
+            colors=["#4A235A", "#1A5276", "#117A65", "#D35400"],
+            hover_data=["games_played"],
+            custom_hovertemplate=HOVER_TEMPLATES["shooting_comparison"],
         )
+        return st.plotly_chart(shooting_comparison, use_container_width=True)
 
-        # Field Goal % Tab
-        with shooting_tabs[0]:
-            shooting_column = "fg_pct"
-            fg_data = shooting_data.sort(shooting_column, descending=True)
-            st.subheader("Field Goal Percentage Leaders")
-            stats_table(fg_data, column_config=column_config)
+    # Compare different shooting stats (FG%, 3PT%, 2PT%, FT%), the shooting
+    # leaderboards only contain entries with the minimum field goal attempts
 
-            fg_fig = stat_bar_chart(
-                fg_data.head(10),
-                x_col=group_name,
-                y_col=shooting_column,
-                title=f"Top 10 FG% Leaders ({selected_season})",
-                colors=["#4A235A"],
-                hover_data=["fg", "fga", "games_played"],
-                custom_hovertemplate="<b>%{x}</b><br>FG%: %{y:.1f}%<br>FGM: %{customdata[0]:.1f}<br>FGA: %{customdata[1]:.1f}<br>GP: %{customdata[2]}<extra></extra>",
-            )
-            st.plotly_chart(fg_fig, use_container_width=True)
-
-            # Show multi-shooting comparison chart
-            multi_shooting_comparison(shooting_column)
+    # Create tabs for different shooting metrics
+    shooting_tabs = st.tabs(
+        ["Field Goal %", "Three-Point %", "Two-Point %", "Free Throw %"]
+    )
 
-        # Three-Point % Tab
-        with shooting_tabs[1]:
-            shooting_column = "three_p_pct"
-            three_p_data = shooting_data.filter(pl.col("three_pa") >= 1).sort(
-                shooting_column, descending=True
-            )
-            st.subheader("Three-Point Percentage Leaders")
-            stats_table(three_p_data, column_config=column_config)
+    # Field Goal % Tab
+    with shooting_tabs[0]:
+        shooting_column = "fg_pct"
+        fg_data = leaders[shooting_column]
+        st.subheader("Field Goal Percentage Leaders")
+        stats_table(fg_data, column_config=column_config)
 
-            three_p_fig = stat_bar_chart(
-                three_p_data.head(10),
-                x_col=group_name,
-                y_col=shooting_column,
-                title=f"Top 10 3PT% Leaders ({selected_season})",
-                colors=["#1A5276"],
-                hover_data=["three_p", "three_pa", "games_played"],
-                custom_hovertemplate="<b>%{x}</b><br>3P%: %{y:.1f}%<br>3PM: %{customdata[0]:.1f}<br>3PA: %{customdata[1]:.1f}<br>GP: %{customdata[2]}<extra></extra>",
-            )
-            st.plotly_chart(three_p_fig, use_container_width=True)
+        fg_fig = stat_bar_chart(
+            fg_data.head(10),
+            x_col=group_name,
+            y_col=shooting_column,
+            title=f"Top 10 FG% Leaders ({selected_season})",
+            colors=["#4A235A"],
+            hover_data=["fg", "fga", "games_played"],
+            custom_hovertemplate=HOVER_TEMPLATES[shooting_column],
+        )
+        st.plotly_chart(fg_fig, use_container_width=True)
 
-            # Show multi-shooting comparison chart
-            multi_shooting_comparison(shooting_column)
+        # Show multi-shooting comparison chart
+        multi_shooting_comparison(fg_data)
 
-        # Two-Point % Tab
-        with shooting_tabs[2]:
-            shooting_column = "two_p_pct"
-            two_p_data = shooting_data.filter(pl.col("two_papg") >= 2).sort(
-                shooting_column, descending=True
-            )
-            st.subheader("Two-Point Percentage Leaders")
-            stats_table(two_p_data, column_config=column_config)
+    # Three-Point % Tab
+    with shooting_tabs[1]:
+        shooting_column = "three_p_pct"
+        three_p_data = leaders[shooting_column].filter(pl.col("three_pa") >= 1)
+        st.subheader("Three-Point Percentage Leaders")
+        stats_table(three_p_data, column_config=column_config)
 
-            two_p_fig = stat_bar_chart(
-                two_p_data.head(10),
-                x_col=group_name,
-                y_col=shooting_column,
-                title=f"Top 10 2PT% Leaders ({selected_season})",
-                colors=["#117A65"],
-                hover_data=["two_ppg", "two_papg", "games_played"],
-                custom_hovertemplate="<b>%{x}</b><br>2P%: %{y:.1f}%<br>2PM: %{customdata[0]:.1f}<br>2PA: %{customdata[1]:.1f}<br>GP: %{customdata[2]}<extra></extra>",
-            )
-            st.plotly_chart(two_p_fig, use_container_width=True)
+        three_p_fig = stat_bar_chart(
+            three_p_data.head(10),
+            x_col=group_name,
+            y_col=shooting_column,
+            title=f"Top 10 3PT% Leaders ({selected_season})",
+            colors=["#1A5276"],
+            hover_data=["three_p", "three_pa", "games_played"],
+            custom_hovertemplate=HOVER_TEMPLATES[shooting_column],
+        )
+        st.plotly_chart(three_p_fig, use_container_width=True)
 
-            # Show multi-shooting comparison chart
-            multi_shooting_comparison(shooting_column)
+        # Show multi-shooting comparison chart
+        multi_shooting_comparison(three_p_data)
 
-        # Free Throw % Tab
-        with shooting_tabs[3]:
-            shooting_column = "ft_pct"
-            ft_data = shooting_data.filter(pl.col("fta") >= 1).sort(
-                shooting_column, descending=True
-            )
-            st.subheader("Free Throw Percentage Leaders")
-            stats_table(ft_data, column_config=column_config)
+    # Two-Point % Tab
+    with shooting_tabs[2]:
+        shooting_column = "two_p_pct"
+        two_p_data = leaders[shooting_column].filter(pl.col("two_papg") >= 2)
+        st.subheader("Two-Point Percentage Leaders")
+        stats_table(two_p_data, column_config=column_config)
 
-            ft_fig = stat_bar_chart(
-                ft_data.head(10),
-                x_col=group_name,
-                y_col=shooting_column,
-                title=f"Top 10 FT% Leaders ({selected_season})",
-                colors=["#D35400"],
-                hover_data=["ft", "fta", "games_played"],
-                custom_hovertemplate="<b>%{x}</b><br>FT%: %{y:.1f}%<br>FTM: %{customdata[0]:.1f}<br>FTA: %{customdata[1]:.1f}<br>GP: %{customdata[2]}<extra></extra>",
-            )
-            st.plotly_chart(ft_fig, use_container_width=True)
+        two_p_fig = stat_bar_chart(
+            two_p_data.head(10),
+            x_col=group_name,
+            y_col=shooting_column,
+            title=f"Top 10 2PT% Leaders ({selected_season})",
+            colors=["#117A65"],
+            hover_data=["two_ppg", "two_papg", "games_played"],
+            custom_hovertemplate=HOVER_TEMPLATES[shooting_column],
+        )
+        st.plotly_chart(two_p_fig, use_container_width=True)
 
-            # Show multi-shooting comparison chart
-            multi_shooting_comparison(shooting_column)
+        # Show multi-shooting comparison chart
+        multi_shooting_comparison(two_p_data)
 
-    # Create tabbed interface
-    tabbed_interface(
-        {
-            "Overview": show_overview,
-            "Points": show_points,
-            "Rebounds": show_rebounds,
-            "Assists": show_assists,
-            "Defense": show_defense,
-            "Shooting": show_shooting,
-        }
-    )
+    # Free Throw % Tab
+    with shooting_tabs[3]:
+        shooting_column = "ft_pct"
+        ft_data = leaders[shooting_column].filter(pl.col("fta") >= 1)
+        st.subheader("Free Throw Percentage Leaders")
+        stats_table(ft_data, column_config=column_config)
 
-else:
-    st.warning(f"No data available for season {selected_season}.")
+        ft_fig = stat_bar_chart(
+            ft_data.head(10),
+            x_col=group_name,
+            y_col=shooting_column,
+            title=f"Top 10 FT% Leaders ({selected_season})",
+            colors=["#D35400"],
+            hover_data=["ft", "fta", "games_played"],
+            custom_hovertemplate=HOVER_TEMPLATES[shooting_column],
+        )
+        st.plotly_chart(ft_fig, use_container_width=True)
+
+        # Show multi-shooting comparison chart
+        multi_shooting_comparison(ft_data)
+
+
+# Create tabbed interface
+tabbed_interface(
+    {
+        "Overview": show_overview,
+        "Points": show_points,
+        "Rebounds": show_rebounds,
+        "Assists": show_assists,
+        "Defense": show_defense,
+        "Shooting": show_shooting,
+    },
+    fragments=True,
+)
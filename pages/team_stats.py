@@ -7,7 +7,7 @@ import streamlit as st
 import polars as pl
 
 from utils.connection import get_connection
-from data.queries import get_team_stats
+from data.queries import get_team_season_aggregates, get_team_stats
 from utils.app_state import AppState
 from utils.team_processing import (
     prepare_team_data,
@@ -21,9 +21,6 @@ from utils.data_processing import (
     get_against_opponents_stats,
     get_shooting_stats,
 )
-from utils.stats_aggregation import (
-    calculate_win_loss_record,
-)
 from data.column_config import (
     TEAM_STAT_AGG_COLUMN_CONFIG,
     TEAM_GAME_LOG_COLUMN_CONFIG,
@@ -47,13 +44,106 @@ from components.charts import (
 )
 from components.layout import tabbed_interface
 
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_team_data(
+    team_abbreviation: str, nba_teams: frozenset[str]
+) -> pl.DataFrame | None:
+    """
+    Fetch and prepare all games of a team, cached per team.
+
+    Args:
+        team_abbreviation: Abbreviation of the team to load
+        nba_teams: Abbreviations of the NBA teams, used to flag NBA opponents
+
+    Returns:
+        Prepared team data, or None if the team has no games
+    """
+    with get_connection() as conn:
+        team_data_raw = get_team_stats(conn, team_abbreviation)
+
+    if team_data_raw.is_empty():
+        return None
+
+    return prepare_team_data(team_data_raw, nba_teams=nba_teams)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_team_metadata(
+    team_abbreviation: str, nba_teams: frozenset[str]
+) -> tuple[list[str], list[str]]:
+    """
+    Get the NBA opponents and the seasons of a team for the sidebar filters.
+
+    Args:
+        team_abbreviation: Abbreviation of the team
+        nba_teams: Abbreviations of the NBA teams
+
+    Returns:
+        Tuple with the sorted opponents and the seasons, most recent first
+    """
+    team_data = load_team_data(team_abbreviation, nba_teams)
+    if team_data is None:
+        return [], []
+
+    # Few distinct opponents, a set intersection is enough
+    unique_opponents = sorted(set(team_data.get_column("opponent")) & nba_teams)
+    team_seasons = team_data.get_column("season").unique().sort(descending=True)
+
+    return unique_opponents, team_seasons.to_list()
+
+
+@st.cache_data(show_spinner=False, max_entries=50)
+def load_opponent_stats(data: pl.DataFrame) -> pl.DataFrame:
+    """
+    Aggregate the stats of a team against each of its NBA opponents.
+
+    Args:
+        data: Filtered team data
+
+    Returns:
+        DataFrame with one row per NBA opponent
+    """
+    return get_against_opponents_stats(
+        data.lazy().filter(pl.col("is_nba_opponent"))
+    ).collect()
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=50)
+def load_season_trend(team_abbreviation: str, filters: dict) -> pl.DataFrame:
+    """
+    Fetch the stats of a team aggregated by season for the trend charts.
+
+    Args:
+        team_abbreviation: Abbreviation of the team
+        filters: Game type and opponent filters
+
+    Returns:
+        DataFrame with one row per season
+    """
+    with get_connection() as conn:
+        return get_team_season_aggregates(conn, team_abbreviation, filters)
+
+
+@st.cache_data(show_spinner=False, max_entries=50)
+def load_shooting_stats(data: pl.DataFrame) -> pl.DataFrame:
+    """
+    Aggregate the shooting stats of a team by season.
+
+    Args:
+        data: Filtered team data
+
+    Returns:
+        DataFrame with the shooting stats by season
+    """
+    return get_shooting_stats(data)
+
+
 # Initialize core state (teams, seasons)
 AppState.initialize_core_state()
 
-# List of NBA teams
-nba_teams = (
-    pl.DataFrame(st.session_state["teams"]).select("abbreviation").to_series().to_list()
-)
+# Abbreviations of the NBA teams
+nba_teams = st.session_state["nba_team_abbrs"]
 # Page header
 page_header("Team Stats")
 
@@ -61,9 +151,7 @@ page_header("Team Stats")
 team_options = [""] + [team["name"] for team in st.session_state.get("teams", [])]
 
 # Check if a team is selected from another page and set the selectbox default
-default_selection = ""
-if st.session_state.get("selected_team", ""):
-    default_selection = st.session_state.get("selected_team")
+default_selection = st.session_state.get("selected_team", "")
 
 selected_team = st.selectbox(
     "Select a Team",
@@ -73,60 +161,30 @@ selected_team = st.selectbox(
     else 0,
 )
 
-# Clear the session state selected_team if user explicitly selects a different team
-if selected_team != st.session_state.get("selected_team", ""):
-    if selected_team == "":
-        st.session_state["selected_team"] = ""
-    else:
-        st.session_state["selected_team"] = selected_team
-
-# Use the selected team from selectbox as the primary source
-if not selected_team:
-    selected_team = ""
-
-
-# Function to get team abbreviation from name
-def get_team_abbreviation(team_name):
-    for team in st.session_state.get("teams", []):
-        if team["name"] == team_name:
-            return team["abbreviation"]
-    return None
-
+# Keep the session state in sync with the selectbox, the primary source
+st.session_state["selected_team"] = selected_team
 
 # If a team is selected, get its data
 if selected_team:
-    team_abbreviation = get_team_abbreviation(selected_team)
+    team_abbreviation = st.session_state["team_name_to_abbr"].get(selected_team.upper())
 
     if team_abbreviation:
+        # Display team logo and name before waiting on the team query
+        team_header(name=selected_team, team_abbreviation=team_abbreviation)
+
         # Get team data
-        conn = get_connection()
-        team_data_raw = get_team_stats(conn, team_abbreviation)
-        conn.close()
-
-        if not team_data_raw.is_empty():
-            # Process team data
-            team_data = prepare_team_data(team_data_raw)
-
-            # Get unique opponents for filter
-            unique_opponents = (
-                team_data.filter(pl.col("opponent").is_in(nba_teams))
-                .select("opponent")
-                .unique("opponent")
-                .sort("opponent", descending=False, maintain_order=True)
-                .to_series()
-                .to_list()
-            )
+        team_data = load_team_data(team_abbreviation, nba_teams)
 
-            # Display team logo and name
-            team_header(name=selected_team, team_abbreviation=team_abbreviation)
+        if team_data is not None:
+            # Get unique opponents and seasons for filters
+            unique_opponents, team_seasons = get_team_metadata(
+                team_abbreviation, nba_teams
+            )
 
             # Sidebar filters
 
             # Season selector
-            team_seasons = (
-                team_data.select("season").unique().sort("season", descending=True)
-            )
-            season_options = ["All Seasons"] + team_seasons["season"].to_list()
+            season_options = ["All Seasons"] + team_seasons
             selected_season = season_filter(
                 key_prefix="team_", seasons=season_options, sidebar=True
             )
@@ -151,17 +209,25 @@ if selected_team:
                 "opponent": selected_opponent,
             }
 
-            # Filter data using the filter_data_by_game_filters function
-            filtered_data = filter_data_by_game_filters(team_data, filters)
-
-            # Create separate filtered data for different views
-            filtered_data_without_opponent = filter_data_by_game_filters(
-                team_data, {k: v for k, v in filters.items() if k != "opponent"}
-            )
-
-            # Create separate filtered data for trends (without season filter)
-            filtered_data_without_season = filter_data_by_game_filters(
-                team_data, {k: v for k, v in filters.items() if k != "season"}
+            # Season trends span all seasons of the team
+            filters_without_season = {k: v for k, v in filters.items() if k != "season"}
+
+            # Filter data using the filter_data_by_game_filters function, with
+            # separate views without the opponent and without the season filter,
+            # collected together so they share the scan of team_data
+            team_lf = team_data.lazy()
+            (
+                filtered_data,
+                filtered_data_without_opponent,
+                filtered_data_without_season,
+            ) = pl.collect_all(
+                [
+                    filter_data_by_game_filters(team_lf, filters),
+                    filter_data_by_game_filters(
+                        team_lf, {k: v for k, v in filters.items() if k != "opponent"}
+                    ),
+                    filter_data_by_game_filters(team_lf, filters_without_season),
+                ]
             )
 
             if filtered_data.is_empty():
@@ -172,29 +238,33 @@ if selected_team:
             def show_team_overview():
                 # Display team overview stats
 
-                # Get team record
-                record = calculate_win_loss_record(filtered_data)
-
-                # Calculate basic team stats
-                team_stats = get_team_overall_stats(filtered_data)
-
-                team_seasons_data = get_team_season_stats(filtered_data)
+                # Calculate basic team stats, season stats and win percentage
+                # data per location in one run over filtered_data
+                filtered_lf = filtered_data.lazy()
+                team_stats, team_seasons_data, win_pct_data = pl.collect_all(
+                    [
+                        get_team_overall_stats(filtered_lf),
+                        get_team_season_stats(filtered_lf),
+                        get_win_percentage_data(filtered_lf, selected_opponent),
+                    ]
+                )
 
                 # Display team metrics
                 if not team_stats.is_empty():
+                    overall = team_stats.row(0, named=True)
                     cols = st.columns(6)
                     with cols[0]:
-                        st.metric("Record", f"{record['wins']}-{record['losses']}")
+                        st.metric("Record", f"{overall['wins']}-{overall['losses']}")
                     with cols[1]:
-                        st.metric("PPG", f"{team_stats[0, 'ppg']:.1f}")
+                        st.metric("PPG", f"{overall['ppg']:.1f}")
                     with cols[2]:
-                        st.metric("RPG", f"{team_stats[0, 'rpg']:.1f}")
+                        st.metric("RPG", f"{overall['rpg']:.1f}")
                     with cols[3]:
-                        st.metric("APG", f"{team_stats[0, 'apg']:.1f}")
+                        st.metric("APG", f"{overall['apg']:.1f}")
                     with cols[4]:
-                        st.metric("FG%", f"{team_stats[0, 'fg_pct'] * 100:.1f}%")
+                        st.metric("FG%", f"{overall['fg_pct'] * 100:.1f}%")
                     with cols[5]:
-                        st.metric("3P%", f"{team_stats[0, 'three_p_pct'] * 100:.1f}%")
+                        st.metric("3P%", f"{overall['three_p_pct'] * 100:.1f}%")
                 # Display team stats table
                 if not team_seasons_data.is_empty():
                     with st.expander("Season Team Statistics", expanded=True):
@@ -202,11 +272,8 @@ if selected_team:
                             team_seasons_data, column_config=TEAM_STAT_AGG_COLUMN_CONFIG
                         )
 
-                # Prepare data for win percentage chart per location
-                win_pct_data = get_win_percentage_data(filtered_data, selected_opponent)
-
                 # Display win percentage chart
-                if win_pct_data:
+                if not win_pct_data.is_empty():
                     fig = win_percentage_chart(win_pct_data)
                     with st.expander("Win Percentage by Location", expanded=True):
                         st.plotly_chart(fig, use_container_width=True)
@@ -218,9 +285,7 @@ if selected_team:
 
             def show_opponent_stats():
                 # Display stats vs opponents
-                opponent_stats = get_against_opponents_stats(
-                    filtered_data_without_opponent
-                ).filter(pl.col("opponent").is_in(nba_teams))
+                opponent_stats = load_opponent_stats(filtered_data_without_opponent)
 
                 # Show opponent win percentage chart
                 if not opponent_stats.is_empty():
@@ -253,42 +318,8 @@ if selected_team:
 
             def show_trends():
                 # Create season trend data
-                season_trend = (
-                    filtered_data_without_season.with_columns(
-                        pl.when(pl.col("outcome") == 1)
-                        .then(pl.lit(1))
-                        .otherwise(pl.lit(0))
-                        .alias("wins"),
-                        pl.when(pl.col("outcome") == 0)
-                        .then(pl.lit(1))
-                        .otherwise(pl.lit(0))
-                        .alias("losses"),
-                    )
-                    .group_by(["season", "team"])
-                    .agg(
-                        pl.len().alias("games_played"),
-                        pl.mean("points").round(1).alias("ppg"),
-                        pl.mean("assists").round(1).alias("apg"),
-                        pl.mean("rebounds").round(1).alias("rpg"),
-                        pl.mean("offensive_rebounds").round(1).alias("orpg"),
-                        pl.mean("defensive_rebounds").round(1).alias("drpg"),
-                        pl.mean("steals").round(1).alias("spg"),
-                        pl.mean("blocks").round(1).alias("bpg"),
-                        pl.mean("field_goal_percent").mul(100).round(1).alias("fg_pct"),
-                        pl.mean("three_point_percent")
-                        .mul(100)
-                        .round(1)
-                        .alias("three_p_pct"),
-                        pl.mean("attempted_three_point").round(1).alias("three_pa"),
-                        pl.sum("wins").alias("wins"),
-                        pl.sum("losses").alias("losses"),
-                    )
-                    .with_columns(
-                        (pl.col("wins") / (pl.col("wins") + pl.col("losses"))).alias(
-                            "win_percentage"
-                        )
-                    )
-                    .sort("season")
+                season_trend = load_season_trend(
+                    team_abbreviation, filters_without_season
                 )
                 if not season_trend.is_empty():
                     # Display basic stats trend
@@ -336,7 +367,7 @@ if selected_team:
 
                         # Generate shooting stats data based on selection
                         if shooting_stats_selected:
-                            shooting_data = get_shooting_stats(
+                            shooting_data = load_shooting_stats(
                                 filtered_data_without_season
                             )
 
@@ -371,7 +402,8 @@ if selected_team:
                     "Game Log": show_game_log,
                     "Opponent Stats": show_opponent_stats,
                     "Trends": show_trends,
-                }
+                },
+                fragments=True,
             )
 
         else:
@@ -4,14 +4,26 @@ Manages application state and session variables.
 """
 
 import streamlit as st
-from typing import Dict, Any, Optional, TypeVar
+from typing import Dict, Any, List, Optional, Tuple, TypeVar
 
 from utils.connection import get_connection
-from data.queries import get_teams_list, get_seasons_list
+from data.queries import get_reference_lists
 
 T = TypeVar("T")
 
 
+@st.cache_resource(ttl=86400, show_spinner=False)
+def load_reference_data() -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Load the teams and seasons lists, shared by all sessions.
+
+    Returns:
+        Tuple with the list of team dictionaries and the list of seasons
+    """
+    with get_connection() as conn:
+        return get_reference_lists(conn)
+
+
 class AppState:
     """
     Singleton class to manage application state consistently across pages.
@@ -27,12 +39,25 @@ class AppState:
         """
         # Load teams and seasons data if not already in session state
         if "teams" not in st.session_state or "seasons" not in st.session_state:
-            conn = get_connection()
-            if "teams" not in st.session_state:
-                st.session_state["teams"] = get_teams_list(conn)
-            if "seasons" not in st.session_state:
-                st.session_state["seasons"] = get_seasons_list(conn)
-            conn.close()
+            teams, seasons = load_reference_data()
+            st.session_state.setdefault("teams", teams)
+            st.session_state.setdefault("seasons", seasons)
+
+        # Case-insensitive team lookups derived from the teams list
+        if (
+            "team_name_to_abbr" not in st.session_state
+            or "team_abbr_to_name" not in st.session_state
+        ):
+            teams = st.session_state["teams"]
+            st.session_state["team_name_to_abbr"] = {
+                team["name"].upper(): team["abbreviation"] for team in teams
+            }
+            st.session_state["team_abbr_to_name"] = {
+                team["abbreviation"].upper(): team["name"] for team in teams
+            }
+            st.session_state["nba_team_abbrs"] = frozenset(
+                team["abbreviation"] for team in teams
+            )
 
         # Initialize selected_game if not present
         if "selected_game" not in st.session_state:
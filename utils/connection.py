@@ -4,8 +4,12 @@ Provides functions to establish and manage database connections.
 """
 
 import logging
-import psycopg2
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Tuple
+
 from psycopg2.extensions import connection
+from psycopg2.pool import ThreadedConnectionPool
 import streamlit as st
 
 DB_PARAMS = {
@@ -16,21 +20,56 @@ DB_PARAMS = {
     "port": st.secrets["DATABASE_PORT"],
 }
 
+# Maximum number of connections opened by the pool
+MAX_CONNECTIONS = 10
+
 logger = logging.getLogger(__name__)
 
 
-def get_connection() -> connection:
+@st.cache_resource
+def get_connection_pool() -> Tuple[ThreadedConnectionPool, threading.BoundedSemaphore]:
     """
-    Get a connection to the PostgreSQL database.
+    Get the PostgreSQL connection pool shared by all sessions.
 
-    This function uses the connection parameters stored in the Streamlit secrets.
+    The pool is created on first use with the connection parameters stored in
+    the Streamlit secrets. It comes with a semaphore counting its free
+    connections, since the pool raises instead of waiting when exhausted.
 
     Returns:
-        connection: A PostgreSQL database connection
+        Tuple of the thread-safe connection pool and its semaphore
     """
     try:
-        conn = psycopg2.connect(**DB_PARAMS)
-        return conn
+        pool = ThreadedConnectionPool(minconn=1, maxconn=MAX_CONNECTIONS, **DB_PARAMS)
+        return pool, threading.BoundedSemaphore(MAX_CONNECTIONS)
     except Exception as e:
         logger.error(f"Error connecting to database: {e}")
         raise
+
+
+@contextmanager
+def get_connection() -> Iterator[connection]:
+    """
+    Borrow a connection to the PostgreSQL database from the pool.
+
+    Waits for a free connection when all of them are in use. Use as a context
+    manager, the connection is returned to the pool on exit:
+
+        with get_connection() as conn:
+            ...
+
+    Yields:
+        connection: A PostgreSQL database connection
+    """
+    pool, available = get_connection_pool()
+    available.acquire()
+    try:
+        conn = pool.getconn()
+        try:
+            # Read-only queries, avoid returning a connection with an open transaction
+            conn.autocommit = True
+            yield conn
+        finally:
+            # Drop connections that were closed by the server instead of reusing them
+            pool.putconn(conn, close=bool(conn.closed))
+    finally:
+        available.release()
@@ -6,7 +6,7 @@ Includes data formatters and team utility functions.
 
 import datetime
 import polars as pl
-from typing import Literal
+from typing import Literal, Union
 
 
 def format_percentage_columns(df: pl.DataFrame) -> pl.DataFrame:
@@ -26,16 +26,13 @@ def format_percentage_columns(df: pl.DataFrame) -> pl.DataFrame:
         col for col in df.columns if col.endswith("_pct") or col.endswith("_percent")
     ]
 
-    for col in percentage_cols:
-        if col in df.columns:
-            df = df.with_columns(
-                pl.when(pl.col(col).is_null())
-                .then(pl.lit(""))
-                .otherwise((pl.col(col) * 100).round(1).cast(pl.Utf8) + "%")
-                .alias(col)
-            )
-
-    return df
+    return df.with_columns(
+        pl.when(pl.col(col).is_null())
+        .then(pl.lit(""))
+        .otherwise((pl.col(col) * 100).round(1).cast(pl.Utf8) + "%")
+        .alias(col)
+        for col in percentage_cols
+    )
 
 
 def format_numeric_columns(df: pl.DataFrame) -> pl.DataFrame:
@@ -56,11 +53,7 @@ def format_numeric_columns(df: pl.DataFrame) -> pl.DataFrame:
         col for col in df.columns if col.endswith("_per_game") or col.endswith("pg")
     ]
 
-    for col in decimal_cols:
-        if col in df.columns:
-            df = df.with_columns(pl.col(col).round(1))
-
-    return df
+    return df.with_columns(pl.col(decimal_cols).round(1))
 
 
 def format_stats_for_display(df: pl.DataFrame) -> pl.DataFrame:
@@ -80,22 +73,24 @@ def format_stats_for_display(df: pl.DataFrame) -> pl.DataFrame:
 
 
 def format_seconds_to_minutes(
-    df: pl.DataFrame,
+    df: Union[pl.DataFrame, pl.LazyFrame],
     seconds_col: str = "seconds_played",
     format_type: Literal["time", "str", "float"] = "time",
-) -> pl.DataFrame:
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Convert seconds to minutes with different format options.
 
     Args:
-        df: DataFrame with seconds column
+        df: DataFrame or LazyFrame with seconds column
         seconds_col: Name of the seconds column
         format_type: Output format - "time" (MM:SS), "str" (MM:SS), or "float" (decimal minutes)
 
     Returns:
-        DataFrame with formatted minutes column
+        DataFrame or LazyFrame with formatted minutes column
     """
-    if df.is_empty() or seconds_col not in df.columns:
+    if seconds_col not in df.collect_schema().names():
+        return df
+    if isinstance(df, pl.DataFrame) and df.is_empty():
         return df
 
     if format_type == "float":
@@ -104,29 +99,14 @@ def format_seconds_to_minutes(
             (pl.col(seconds_col) / 60).round(1).alias("minutes_played")
         )
     else:
-        # Convert to MM:SS format
-        df = (
-            df.with_columns(
-                [
-                    (pl.col(seconds_col) // 60).alias("minutes"),
-                    (pl.col(seconds_col) % 60).alias("seconds"),
-                ]
-            )
-            .with_columns(
-                pl.when(pl.col("seconds") < 10)
-                .then(
-                    pl.col("minutes").cast(pl.Utf8)
-                    + ":0"
-                    + pl.col("seconds").cast(pl.Utf8)
-                )
-                .otherwise(
-                    pl.col("minutes").cast(pl.Utf8)
-                    + ":"
-                    + pl.col("seconds").cast(pl.Utf8)
-                )
-                .alias("minutes_played")
-            )
-            .drop(["minutes", "seconds"])
+        # Convert to MM:SS format, minutes are not wrapped at 60 so that
+        # overtime and team totals stay correct
+        df = df.with_columns(
+            pl.format(
+                "{}:{}",
+                pl.col(seconds_col) // 60,
+                (pl.col(seconds_col) % 60).cast(pl.Utf8).str.zfill(2),
+            ).alias("minutes_played")
         )
 
     return df
@@ -168,8 +148,9 @@ def format_datetime_for_display(
 
 # Legacy alias for backward compatibility
 def format_sp_into_mp(
-    df: pl.DataFrame, format: Literal["time", "str", "float"] = "time"
-) -> pl.DataFrame:
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    format: Literal["time", "str", "float"] = "time",
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Legacy function - use format_seconds_to_minutes instead.
 
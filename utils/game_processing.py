@@ -12,6 +12,14 @@ from data.column_mapping import (
 )
 from utils.formatting import format_stats_for_display, format_sp_into_mp
 
+# minutes_played values of players who did not play
+DNP_VALUES = [
+    "did not play",
+    "not with team",
+    "did not dress",
+    "player suspended",
+]
+
 
 def prepare_players_boxscore(
     players_data: pl.DataFrame, stats_columns: List[str], include_sorting: bool = True
@@ -54,15 +62,8 @@ def prepare_players_boxscore(
             [
                 # Check if minutes_played is one of the DNP values
                 pl.when(
-                    pl.col("minutes_played")
-                    .str.to_lowercase()
-                    .is_in(
-                        [
-                            "did not play",
-                            "not with team",
-                            "did not dress",
-                            "player suspended",
-                        ]
+                    pl.col("minutes_played").str.contains_any(
+                        DNP_VALUES, ascii_case_insensitive=True
                     )
                 )
                 .then(0)  # If DNP, set played_value to 0
@@ -75,69 +76,71 @@ def prepare_players_boxscore(
 
 
 def filter_data_by_game_filters(
-    df: pl.DataFrame, filters: Dict[str, Any]
-) -> pl.DataFrame:
+    df: Union[pl.DataFrame, pl.LazyFrame], filters: Dict[str, Any]
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Apply common game filters to a DataFrame.
 
+    All conditions are combined into a single filter. A LazyFrame input returns a
+    LazyFrame, so several filtered variants of the same data can be collected
+    together.
+
     Args:
-        df: DataFrame to filter
+        df: DataFrame or LazyFrame to filter
         filters: dictionary of filter conditions
 
     Returns:
-        Filtered DataFrame
+        Filtered DataFrame or LazyFrame
     """
-    filtered_df = df
+    columns = df.collect_schema().names()
+    predicates = []
 
     # Apply season filter
-    if "season" in filters and "season" in filtered_df.columns:
+    if "season" in filters and "season" in columns:
         if filters["season"] != "All Seasons":
-            filtered_df = filtered_df.filter(pl.col("season") == filters["season"])
+            predicates.append(pl.col("season") == filters["season"])
 
     # Apply game type filter
-    if "game_type" in filters and "game_type" in filtered_df.columns:
-        if filters["game_type"] != "all":
-            if filters["game_type"] == "regular season":
-                filtered_df = filtered_df.filter(
-                    (pl.col("game_type").str.to_lowercase() == "regular season")
-                    | (
-                        (
-                            pl.col("game_type").str.to_lowercase()
-                            == "in-season tournament"
-                        )
-                        & (
-                            pl.col("game_remarks").str.to_lowercase()
-                            != "championship game"
-                        )
-                    )
+    if "game_type" in filters and "game_type" in columns:
+        game_type = pl.col("game_type").str.to_lowercase()
+        if filters["game_type"] == "regular season":
+            # In-season tournament games count, except the championship game
+            # (games without remarks are kept, as in the SQL queries)
+            predicates.append(
+                (game_type == "regular season")
+                | (
+                    (game_type == "in-season tournament")
+                    & pl.col("game_remarks")
+                    .str.to_lowercase()
+                    .ne_missing("championship game")
                 )
-            filtered_df = filtered_df.filter(
-                pl.col("game_type").str.to_lowercase() == filters["game_type"]
             )
+        elif filters["game_type"] != "all":
+            predicates.append(game_type == filters["game_type"])
 
     # Apply team filter
     if "team" in filters:
-        if "team" in filtered_df.columns:
-            filtered_df = filtered_df.filter(pl.col("team") == filters["team"])
-        elif "home_team" in filtered_df.columns and "away_team" in filtered_df.columns:
-            filtered_df = filtered_df.filter(
+        if "team" in columns:
+            predicates.append(pl.col("team") == filters["team"])
+        elif "home_team" in columns and "away_team" in columns:
+            predicates.append(
                 (pl.col("home_team") == filters["team"])
                 | (pl.col("away_team") == filters["team"])
             )
 
     # Apply opponent filter
-    if "opponent" in filters and "opponent" in filtered_df.columns:
+    if "opponent" in filters and "opponent" in columns:
         if filters["opponent"] != "All Teams":
-            filtered_df = filtered_df.filter(pl.col("opponent") == filters["opponent"])
+            predicates.append(pl.col("opponent") == filters["opponent"])
 
     # Apply date range filters
-    if "date_from" in filters and "date" in filtered_df.columns:
-        filtered_df = filtered_df.filter(pl.col("date") >= filters["date_from"])
+    if "date_from" in filters and "date" in columns:
+        predicates.append(pl.col("date") >= filters["date_from"])
 
-    if "date_to" in filters and "date" in filtered_df.columns:
-        filtered_df = filtered_df.filter(pl.col("date") <= filters["date_to"])
+    if "date_to" in filters and "date" in columns:
+        predicates.append(pl.col("date") <= filters["date_to"])
 
-    return filtered_df
+    return df.filter(*predicates) if predicates else df
 
 
 def prepare_game_result_data(
@@ -152,7 +155,9 @@ def prepare_game_result_data(
         sort_desc: Whether to sort by date descending
 
     Returns:
-        If group_by_date is True: Tuple of (games_df, dates_df)
+        If group_by_date is True: Tuple of (games_df, dates_df), where dates_df
+        holds each date with its display label and the offset and count of its
+        rows in games_df
         If group_by_date is False: games_df
     """
     if games_df.is_empty():
@@ -160,22 +165,24 @@ def prepare_game_result_data(
             return games_df, pl.DataFrame()
         return games_df
 
-    # Add date string column for display
-    games_with_date = games_df.with_columns(
-        pl.col("date").cast(pl.String).alias("date_str")
-    )
-
     # Sort by date
-    sorted_games = games_with_date.sort(
-        "date", descending=sort_desc, maintain_order=True
-    )
+    sorted_games = games_df.sort("date", descending=sort_desc, maintain_order=True)
 
     if group_by_date:
-        # Get unique dates
+        # Get unique dates with the row range of their games in sorted_games,
+        # so each date's games can be sliced instead of filtered
         dates = (
-            sorted_games.select("date", "date_str")
-            .unique()
-            .sort(by="date", descending=sort_desc)
+            sorted_games.with_row_index("offset")
+            .group_by("date", maintain_order=True)
+            .agg(
+                pl.first("offset"),
+                pl.len().alias("games_count"),
+            )
+            # Date strings for display, formatted once per date
+            .with_columns(
+                pl.col("date").cast(pl.String).alias("date_str"),
+                pl.col("date").dt.strftime("%A, %B %d, %Y").alias("date_label"),
+            )
         )
         return sorted_games, dates
 
@@ -5,9 +5,13 @@ Functions specifically for processing and preparing player data.
 
 import polars as pl
 import streamlit as st
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Union
 
-from utils.stats_aggregation import player_stat_agg, calculate_win_loss_record
+from utils.stats_aggregation import (
+    aggregate_player_stat_totals,
+    compute_player_stat_averages,
+    calculate_win_loss_record,
+)
 from data.column_mapping import (
     PLAYERS_COLUMN_MAPPING,
     rename_df_columns,
@@ -36,20 +40,19 @@ def prepare_player_data(
         Processed player data"""
     from utils.game_processing import filter_data_by_game_filters
 
-    # Apply column mapping
-    player_data = rename_df_columns(player_data_raw, PLAYERS_COLUMN_MAPPING)
-
-    # Cast columns to appropriate data types
-    player_data = cast_boxscore_columns(player_data, is_player_boxscore=True)
-
-    # Convert seconds played to minutes played
-    player_data = format_sp_into_mp(player_data, format="time")
+    # Rename and cast in a single lazy plan, minutes are only formatted as
+    # MM:SS for the game log (aggregations use seconds_played)
+    player_data = (
+        player_data_raw.lazy()
+        .pipe(rename_df_columns, PLAYERS_COLUMN_MAPPING)
+        .pipe(cast_boxscore_columns, is_player_boxscore=True)
+    )
 
     # If filters dictionary is provided, use filter_data_by_game_filters
     if filters:
-        return filter_data_by_game_filters(player_data, filters)
-    else:
-        return player_data
+        player_data = filter_data_by_game_filters(player_data, filters)
+
+    return player_data.collect()
 
 
 def prepare_player_stats_by_game(
@@ -65,21 +68,19 @@ def prepare_player_stats_by_game(
     Returns:
         Processed DataFrame ready for display
     """
-    # Apply column mapping
-    player_data_mapped = rename_df_columns(player_data, PLAYERS_COLUMN_MAPPING)
-
-    # Cast columns to appropriate types
-    player_data_cast = cast_boxscore_columns(
-        player_data_mapped, is_player_boxscore=True
+    # Rename, cast and convert seconds played in a single lazy plan
+    player_data_cast = (
+        player_data.lazy()
+        .pipe(rename_df_columns, PLAYERS_COLUMN_MAPPING)
+        .pipe(cast_boxscore_columns, is_player_boxscore=True)
     )
 
     # Convert seconds played to minutes played format if needed
-    if (
-        "seconds_played" in player_data_cast.columns
-        and "minutes_played" not in player_data_cast.columns
-    ):
+    if "minutes_played" not in player_data_cast.collect_schema().names():
         player_data_cast = format_sp_into_mp(player_data_cast, format="time")
 
+    player_data_cast = player_data_cast.collect()
+
     # Format for display
     player_data_formatted = format_stats_for_display(player_data_cast)
 
@@ -113,8 +114,42 @@ def prepare_player_season_stats(
     else:
         filtered_data = player_data
 
-    # Sort by game date
-    game_log = filtered_data.sort("date", descending=True).select(
+    # No games left means there is no team to compute the results for
+    if filtered_data.is_empty():
+        return pl.DataFrame()
+
+    # Result (W/L) from the boxscore outcome, or from the final score otherwise
+    if "outcome" in filtered_data.columns:
+        result = (
+            pl.when(pl.col("outcome") == 1)
+            .then(pl.lit("WIN"))
+            .otherwise(pl.lit("LOSS"))
+        )
+    else:
+        # Look up the player's team name once for both sides of the result
+        team_name = get_team_name_by_abbreviation(
+            team_abbr_to_name=st.session_state["team_abbr_to_name"],
+            abbreviation=filtered_data.item(0, "team"),
+        )
+        result = (
+            pl.when(
+                (pl.col("home_team").str.to_uppercase() == team_name)
+                & (pl.col("home_team_pts") > pl.col("away_team_pts"))
+            )
+            .then(pl.lit("WIN"))
+            .when(
+                (pl.col("away_team").str.to_uppercase() == team_name)
+                & (pl.col("away_team_pts") > pl.col("home_team_pts"))
+            )
+            .then(pl.lit("WIN"))
+            .otherwise(pl.lit("LOSS"))
+        )
+
+    # Format minutes played (MM:SS) for the displayed games only
+    filtered_data = format_sp_into_mp(filtered_data, format="time")
+
+    # Keep the game log columns, then sort by game date
+    game_log = filtered_data.select(
         [
             "date",
             "home_team",
@@ -138,82 +173,49 @@ def prepare_player_season_stats(
             "blocks",
             "turnovers",
             "plus_minus",
+            result.alias("result"),
         ]
-    )
-    # Add result column (W/L)
-    try:
-        game_log = game_log.with_columns(
-            [
-                pl.when(
-                    (
-                        pl.col("home_team").str.to_uppercase()
-                        == get_team_name_by_abbreviation(
-                            teams=st.session_state["teams"],
-                            abbreviation=filtered_data[0, "team"],
-                        )
-                    )
-                    & (pl.col("home_team_pts") > pl.col("away_team_pts"))
-                )
-                .then(pl.lit("WIN"))
-                .when(
-                    (
-                        pl.col("away_team").str.to_uppercase()
-                        == get_team_name_by_abbreviation(
-                            teams=st.session_state["teams"],
-                            abbreviation=filtered_data[0, "team"],
-                        )
-                    )
-                    & (pl.col("away_team_pts") > pl.col("home_team_pts"))
-                )
-                .then(pl.lit("WIN"))
-                .otherwise(pl.lit("LOSS"))
-                .alias("result")
-            ]
-        )
-    except AttributeError as e:
-        print(f"Error: {e}")
-        # Handle case where team abbreviation is not found (means that there are no games)
-        return pl.DataFrame()
+    ).sort("date", descending=True)
 
     # Format percentage columns
     if not game_log.is_empty():
         game_log = game_log.with_columns(
-            [
-                pl.col("field_goal_percent")
-                .mul(100)
-                .round(1)
-                .alias("field_goal_percent"),
-                pl.col("three_point_percent")
-                .mul(100)
-                .round(1)
-                .alias("three_point_percent"),
-            ]
+            pl.col("field_goal_percent", "three_point_percent").mul(100).round(1)
         )
     return game_log
 
 
 def prepare_player_career_stats(
     player_data: pl.DataFrame,
-) -> Tuple[pl.DataFrame, pl.DataFrame, Dict[str, int]]:
+    include_record: bool = True,
+) -> Union[
+    Tuple[pl.DataFrame, pl.DataFrame, Dict[str, int]],
+    Tuple[pl.DataFrame, pl.DataFrame],
+]:
     """
     Prepare player career statistics.
 
     Args:
         player_data: Processed player data
+        include_record: Whether to also compute the win-loss record
 
     Returns:
-        Tuple of (career_stats, career_stats_mean, record)
+        If include_record is True: Tuple of (career_stats, career_stats_mean, record)
+        If include_record is False: Tuple of (career_stats, career_stats_mean)
     """
 
+    # Aggregate the boxscores once by season and team, the career averages are
+    # derived from these totals
+    season_totals = aggregate_player_stat_totals(
+        player_data, group_by=["player_name", "season", "team"]
+    )
+
     # Calculate career stats by season and team
     career_stats = (
-        player_stat_agg(player_data, group_by=["player_name", "season", "team"])
+        compute_player_stat_averages(season_totals)
         .sort("season", descending=True, maintain_order=True)
         .with_columns(
-            pl.col("fg_pct").mul(100).round(2).alias("fg_pct"),
-            pl.col("three_p_pct").mul(100).round(2).alias("three_p_pct"),
-            pl.col("ft_pct").mul(100).round(2).alias("ft_pct"),
-            pl.col("two_p_pct").mul(100).round(2).alias("two_p_pct"),
+            pl.col("fg_pct", "three_p_pct", "ft_pct", "two_p_pct").mul(100).round(2)
         )
         .select(
             [
@@ -243,12 +245,13 @@ def prepare_player_career_stats(
 
     # Calculate career stats mean (overall averages)
     career_stats_mean = (
-        player_stat_agg(player_data, group_by=["player_name"])
+        compute_player_stat_averages(
+            season_totals.group_by("player_name").agg(
+                pl.exclude("season", "team").sum()
+            )
+        )
         .with_columns(
-            pl.col("fg_pct").mul(100).round(2).alias("fg_pct"),
-            pl.col("three_p_pct").mul(100).round(2).alias("three_p_pct"),
-            pl.col("ft_pct").mul(100).round(2).alias("ft_pct"),
-            pl.col("two_p_pct").mul(100).round(2).alias("two_p_pct"),
+            pl.col("fg_pct", "three_p_pct", "ft_pct", "two_p_pct").mul(100).round(2)
         )
         .select(
             [
@@ -274,6 +277,9 @@ def prepare_player_career_stats(
         )
     )
 
+    if not include_record:
+        return career_stats, career_stats_mean
+
     # Calculate win-loss record
     record = calculate_win_loss_record(player_data)
 
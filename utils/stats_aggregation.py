@@ -4,19 +4,129 @@ Core statistical functions for aggregating and calculating NBA statistics.
 """
 
 import polars as pl
-from typing import Dict
+from typing import Dict, List, Union
 from data.cast_types import clean_percentage_values
 
 
+# Boxscore columns the player aggregations are computed from
+PLAYER_STAT_COLUMNS = [
+    "points",
+    "rebounds",
+    "assists",
+    "steals",
+    "blocks",
+    "made_field_goal",
+    "attempted_field_goal",
+    "made_two_point",
+    "attempted_two_point",
+    "made_three_point",
+    "attempted_three_point",
+    "made_free_throw",
+    "attempted_free_throw",
+    "seconds_played",
+]
+
+
+def aggregate_player_stat_totals(
+    df: pl.DataFrame, group_by: Union[str, List[str]] = "player_name"
+) -> pl.DataFrame:
+    """
+    Aggregate player statistics into totals and non-null game counts.
+
+    The totals can be summed again over a coarser grouping before being turned
+    into averages with compute_player_stat_averages.
+
+    Args:
+        df: DataFrame with individual game player statistics
+        group_by: Column(s) to group by (default: player_name)
+
+    Returns:
+        DataFrame with games_played and a total and count column per statistic
+    """
+    # Ensure required columns exist
+    schema = df.collect_schema()
+    missing_cols = [col for col in PLAYER_STAT_COLUMNS if col not in schema]
+    if missing_cols:
+        df = df.with_columns(
+            pl.lit(None, dtype=pl.Int32).alias(col) for col in missing_cols
+        )
+
+    return df.group_by(group_by).agg(
+        pl.len().alias("games_played"),
+        *[pl.sum(col).alias(f"{col}_total") for col in PLAYER_STAT_COLUMNS],
+        *[pl.count(col).alias(f"{col}_count") for col in PLAYER_STAT_COLUMNS],
+    )
+
+
+def per_game_mean(col: str) -> pl.Expr:
+    """
+    Build the per-game mean of a statistic from its total and count columns.
+
+    Args:
+        col: Statistic column name
+
+    Returns:
+        Expression with the mean, null when no game has a value
+    """
+    return (
+        pl.when(pl.col(f"{col}_count") > 0)
+        .then(pl.col(f"{col}_total") / pl.col(f"{col}_count"))
+        .otherwise(None)
+    )
+
+
+def compute_player_stat_averages(totals: pl.DataFrame) -> pl.DataFrame:
+    """
+    Compute per-game averages and shooting percentages from player totals.
+
+    Args:
+        totals: DataFrame returned by aggregate_player_stat_totals
+
+    Returns:
+        DataFrame with aggregated player statistics
+    """
+    agg_df = totals.select(
+        pl.exclude("^.*_total$", "^.*_count$"),
+        per_game_mean("points").alias("ppg"),
+        per_game_mean("rebounds").alias("rpg"),
+        per_game_mean("assists").alias("apg"),
+        per_game_mean("steals").alias("spg"),
+        per_game_mean("blocks").alias("bpg"),
+        (pl.col("made_field_goal_total") / pl.col("attempted_field_goal_total")).alias(
+            "fg_pct"
+        ),
+        (pl.col("made_two_point_total") / pl.col("attempted_two_point_total")).alias(
+            "two_p_pct"
+        ),
+        (
+            pl.col("made_three_point_total") / pl.col("attempted_three_point_total")
+        ).alias("three_p_pct"),
+        (pl.col("made_free_throw_total") / pl.col("attempted_free_throw_total")).alias(
+            "ft_pct"
+        ),
+        (per_game_mean("seconds_played") / 60).alias("minutes_per_game"),
+        per_game_mean("made_field_goal").alias("fg_per_game"),
+        per_game_mean("attempted_field_goal").alias("fga_per_game"),
+        per_game_mean("made_two_point").alias("two_p_per_game"),
+        per_game_mean("attempted_two_point").alias("two_pa_per_game"),
+        per_game_mean("made_three_point").alias("three_p_per_game"),
+        per_game_mean("attempted_three_point").alias("three_pa_per_game"),
+        per_game_mean("made_free_throw").alias("ft_per_game"),
+        per_game_mean("attempted_free_throw").alias("fta_per_game"),
+    )
+
+    return clean_percentage_values(agg_df)
+
+
 def aggregate_player_stats(
-    df: pl.DataFrame, group_by: str = "player_name"
+    df: pl.DataFrame, group_by: Union[str, List[str]] = "player_name"
 ) -> pl.DataFrame:
     """
     Aggregate player statistics with proper calculations.
 
     Args:
         df: DataFrame with individual game player statistics
-        group_by: Column to group by (default: player_name)
+        group_by: Column(s) to group by (default: player_name)
 
     Returns:
         DataFrame with aggregated player statistics
@@ -24,63 +134,7 @@ def aggregate_player_stats(
     if df.is_empty():
         return pl.DataFrame()
 
-    # Ensure required columns exist
-    required_cols = [
-        "points",
-        "rebounds",
-        "assists",
-        "steals",
-        "blocks",
-        "made_field_goal",
-        "attempted_field_goal",
-        "made_two_point",
-        "attempted_two_point",
-        "made_three_point",
-        "attempted_three_point",
-        "made_free_throw",
-        "attempted_free_throw",
-        "seconds_played",
-    ]
-
-    missing_cols = [col for col in required_cols if col not in df.columns]
-    if missing_cols:
-        for col in missing_cols:
-            df = df.with_columns(pl.lit(None).alias(col))
-
-    # Calculate aggregated statistics
-    agg_df = df.group_by(group_by).agg(
-        [
-            pl.len().alias("games_played"),
-            pl.mean("points").alias("ppg"),
-            pl.mean("rebounds").alias("rpg"),
-            pl.mean("assists").alias("apg"),
-            pl.mean("steals").alias("spg"),
-            pl.mean("blocks").alias("bpg"),
-            (pl.sum("made_field_goal") / pl.sum("attempted_field_goal")).alias(
-                "fg_pct"
-            ),
-            (pl.sum("made_two_point") / pl.sum("attempted_two_point")).alias(
-                "two_p_pct"
-            ),
-            (pl.sum("made_three_point") / pl.sum("attempted_three_point")).alias(
-                "three_p_pct"
-            ),
-            (pl.sum("made_free_throw") / pl.sum("attempted_free_throw")).alias(
-                "ft_pct"
-            ),
-            (pl.mean("seconds_played") / 60).alias("minutes_per_game"),
-            pl.mean("made_field_goal").alias("fg_per_game"),
-            pl.mean("attempted_field_goal").alias("fga_per_game"),
-            pl.mean("made_two_point").alias("two_p_per_game"),
-            pl.mean("attempted_two_point").alias("two_pa_per_game"),
-            pl.mean("made_three_point").alias("three_p_per_game"),
-            pl.mean("attempted_three_point").alias("three_pa_per_game"),
-            pl.mean("made_free_throw").alias("ft_per_game"),
-            pl.mean("attempted_free_throw").alias("fta_per_game"),
-        ]
-    )
-
-    return clean_percentage_values(agg_df)
+    return compute_player_stat_averages(aggregate_player_stat_totals(df, group_by))
 
 
 def calculate_win_loss_record(df: pl.DataFrame) -> Dict[str, int]:
@@ -96,81 +150,82 @@ def calculate_win_loss_record(df: pl.DataFrame) -> Dict[str, int]:
     if df.is_empty() or "outcome" not in df.columns:
         return {"wins": 0, "losses": 0}
 
-    wins = df.filter(pl.col("outcome") == 1).height
-    losses = df.filter(pl.col("outcome") == 0).height
+    # Count both outcomes in a single pass
+    return df.select(
+        (pl.col("outcome") == 1).sum().alias("wins"),
+        (pl.col("outcome") == 0).sum().alias("losses"),
+    ).row(0, named=True)
+
 
-    return {"wins": wins, "losses": losses}
+# (made, attempted, percentage) column names of each shot type
+SHOOTING_PERCENTAGE_COLUMNS = [
+    ("made_field_goal", "attempted_field_goal", "field_goal_percent"),
+    ("made_three_point", "attempted_three_point", "three_point_percent"),
+    ("made_free_throw", "attempted_free_throw", "free_throw_percent"),
+]
 
 
-def calculate_shooting_percentages(df: pl.DataFrame) -> pl.DataFrame:
+def calculate_shooting_percentages(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Calculate shooting percentages from made/attempted columns.
 
     Args:
-        df: DataFrame with made/attempted shooting columns
+        df: DataFrame or LazyFrame with made/attempted shooting columns
 
     Returns:
-        DataFrame with calculated shooting percentages
+        DataFrame or LazyFrame with calculated shooting percentages
     """
-    if df.is_empty():
-        return df
-
-    # Field goal percentage
-    if "made_field_goal" in df.columns and "attempted_field_goal" in df.columns:
-        df = df.with_columns(
-            (pl.col("made_field_goal") / pl.col("attempted_field_goal")).alias(
-                "field_goal_percent"
-            )
-        )
-
-    # Three point percentage
-    if "made_three_point" in df.columns and "attempted_three_point" in df.columns:
-        df = df.with_columns(
-            (pl.col("made_three_point") / pl.col("attempted_three_point")).alias(
-                "three_point_percent"
-            )
-        )
+    columns = df.collect_schema()
 
-    # Free throw percentage
-    if "made_free_throw" in df.columns and "attempted_free_throw" in df.columns:
-        df = df.with_columns(
-            (pl.col("made_free_throw") / pl.col("attempted_free_throw")).alias(
-                "free_throw_percent"
-            )
-        )
-
-    return df
+    # Compute every percentage whose made/attempted columns are present at once
+    return df.with_columns(
+        (pl.col(made) / pl.col(attempted)).alias(percent)
+        for made, attempted, percent in SHOOTING_PERCENTAGE_COLUMNS
+        if made in columns and attempted in columns
+    )
 
 
-def filter_by_season(df: pl.DataFrame, season: str) -> pl.DataFrame:
+def filter_by_season(
+    df: Union[pl.DataFrame, pl.LazyFrame], season: str
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Filter DataFrame by season.
 
     Args:
-        df: DataFrame with season column
+        df: DataFrame or LazyFrame with season column
         season: Season to filter by
 
     Returns:
-        Filtered DataFrame
+        Filtered DataFrame or LazyFrame
     """
-    if df.is_empty() or "season" not in df.columns:
+    if "season" not in df.collect_schema():
         return df
 
     return df.filter(pl.col("season") == season)
 
 
-def join_with_schedule(df: pl.DataFrame, schedule: pl.DataFrame) -> pl.DataFrame:
+def join_with_schedule(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    schedule: Union[pl.DataFrame, pl.LazyFrame],
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Join statistics data with schedule information.
 
+    The join is planned lazily so the schedule projection is pushed into it. A
+    LazyFrame input returns a LazyFrame, a DataFrame input a DataFrame.
+
     Args:
-        df: DataFrame with game statistics (must have game_id column)
-        schedule: DataFrame with schedule data
+        df: DataFrame or LazyFrame with game statistics (must have game_id column)
+        schedule: DataFrame or LazyFrame with schedule data
 
     Returns:
-        Joined DataFrame with schedule information
+        Joined DataFrame or LazyFrame with schedule information
     """
-    if df.is_empty() or "game_id" not in df.columns:
+    if "game_id" not in df.collect_schema():
+        return df
+    if isinstance(df, pl.DataFrame) and df.is_empty():
         return df
 
     schedule_cols = [
@@ -184,14 +239,17 @@ def join_with_schedule(df: pl.DataFrame, schedule: pl.DataFrame) -> pl.DataFrame
         "game_type",
     ]
 
-    available_schedule_cols = [col for col in schedule_cols if col in schedule.columns]
+    schedule_schema = schedule.collect_schema()
+    available_schedule_cols = [col for col in schedule_cols if col in schedule_schema]
 
-    return df.join(
-        schedule.select(available_schedule_cols),
+    joined = df.lazy().join(
+        schedule.lazy().select(available_schedule_cols),
         left_on="game_id",
         right_on="id",
     )
 
+    return joined.collect() if isinstance(df, pl.DataFrame) else joined
+
 
 # Legacy function aliases for backward compatibility
 player_stat_agg = aggregate_player_stats
@@ -4,7 +4,7 @@ Functions specifically for processing and preparing team data.
 """
 
 import polars as pl
-from typing import List
+from typing import Collection, List, Optional
 
 from data.column_mapping import (
     TEAMS_COLUMN_MAPPING,
@@ -41,30 +41,37 @@ def prepare_teams_boxscore(
         teams_data_renamed.select(available_columns)
         .pipe(format_stats_for_display)
         .pipe(add_team_logo_url)
-        .select(["team_logo_url"] + available_columns)
     )
 
 
 def prepare_team_data(
     team_data_raw: pl.DataFrame,
+    nba_teams: Optional[Collection[str]] = None,
 ) -> pl.DataFrame:
     """
     Prepare team data for display.
 
     Args:
         team_data_raw: Raw team data
+        nba_teams: Optional abbreviations of the NBA teams, adds an
+            is_nba_opponent column flagging games against one of them
 
     Returns:
         Processed team data
     """
+    # Rename and cast columns in a single lazy plan
+    team_data = (
+        team_data_raw.lazy()
+        .pipe(rename_df_columns, TEAMS_COLUMN_MAPPING)
+        .pipe(cast_boxscore_columns, is_player_boxscore=False)
+    )
 
-    # Apply column mapping
-    team_data = rename_df_columns(team_data_raw, TEAMS_COLUMN_MAPPING)
-
-    # Cast columns to appropriate data types
-    team_data = cast_boxscore_columns(team_data, is_player_boxscore=False)
+    if nba_teams is not None:
+        team_data = team_data.with_columns(
+            pl.col("opponent").is_in(nba_teams).alias("is_nba_opponent")
+        )
 
-    return team_data
+    return team_data.collect()
 
 
 def prepare_team_game_log(
@@ -79,8 +86,8 @@ def prepare_team_game_log(
     Returns:
         Game log DataFrame
     """
-    # Sort by game date
-    game_log = team_data.sort("date", descending=True).select(
+    # Keep the game log columns, then sort by game date
+    game_log = team_data.select(
         [
             "date",
             "game_type",
@@ -105,7 +112,7 @@ def prepare_team_game_log(
             "made_free_throw",
             "free_throw_percent",
         ]
-    )
+    ).sort("date", descending=True)
 
     # Format percentage columns
     if not game_log.is_empty():
@@ -113,22 +120,12 @@ def prepare_team_game_log(
             [
                 pl.col("game_type").str.to_titlecase().alias("game_type"),
                 pl.col("location").str.to_titlecase().alias("location"),
-                pl.when(pl.col("outcome") == 1)
-                .then(True)
-                .otherwise(False)
-                .alias("outcome"),
-                pl.col("field_goal_percent")
-                .mul(100)
-                .round(1)
-                .alias("field_goal_percent"),
-                pl.col("three_point_percent")
-                .mul(100)
-                .round(1)
-                .alias("three_point_percent"),
-                pl.col("free_throw_percent")
+                pl.col("outcome").eq_missing(1).alias("outcome"),
+                pl.col(
+                    "field_goal_percent", "three_point_percent", "free_throw_percent"
+                )
                 .mul(100)
-                .round(1)
-                .alias("free_throw_percent"),
+                .round(1),
             ]
         ).rename({"outcome": "result"})
 
@@ -3,8 +3,10 @@ Team Utilities Module
 Centralized functions for handling team names, abbreviations, and team-related operations.
 """
 
-from typing import Optional, Dict, List, Any
-from datetime import datetime
+from typing import Optional, Dict, Union
+from datetime import date, datetime
+
+import polars as pl
 
 
 # Team abbreviation history for different eras
@@ -91,32 +93,64 @@ TEAM_ABBREVIATION_HISTORY = {
     },
 }
 
+# Abbreviation periods with their dates parsed once at import
+TEAM_ABBREVIATION_PERIODS = {
+    name: (
+        info["abbreviation"],
+        datetime.fromisoformat(info["from"]),
+        datetime.fromisoformat(info["to"]) if info["to"] else None,
+    )
+    for name, info in TEAM_ABBREVIATION_HISTORY.items()
+}
+
+# Same periods as a frame, for lookups over whole columns
+TEAM_ABBREVIATION_PERIODS_DF = pl.DataFrame(
+    [
+        {
+            "history_team_name": name,
+            "history_abbreviation": abbreviation,
+            "history_from": from_date.date(),
+            "history_to": to_date.date() if to_date else None,
+        }
+        for name, (
+            abbreviation,
+            from_date,
+            to_date,
+        ) in TEAM_ABBREVIATION_PERIODS.items()
+    ],
+    schema={
+        "history_team_name": pl.String,
+        "history_abbreviation": pl.String,
+        "history_from": pl.Date,
+        "history_to": pl.Date,
+    },
+)
+
 
-def get_team_abbreviation(teams: List[Dict[str, Any]], team_name: str) -> str:
+def get_team_abbreviation(team_name_to_abbr: Dict[str, str], team_name: str) -> str:
     """
-    Get team abbreviation from team name using the teams list.
+    Get team abbreviation from team name.
 
     Args:
-        teams: List of team dictionaries from database
+        team_name_to_abbr: Abbreviations keyed by upper-cased team name, as in
+            st.session_state["team_name_to_abbr"]
         team_name: Team name to look up
 
     Returns:
         Team abbreviation or empty string if not found
     """
-    for team in teams:
-        if team["name"].lower() == team_name.lower():
-            return team["abbreviation"]
-    return ""
+    return team_name_to_abbr.get(team_name.upper(), "")
 
 
 def get_team_name_by_abbreviation(
-    teams: List[Dict[str, Any]], abbreviation: str
+    team_abbr_to_name: Dict[str, str], abbreviation: str
 ) -> str:
     """
     Get team name from team abbreviation.
 
     Args:
-        teams: List of team dictionaries from database
+        team_abbr_to_name: Team names keyed by upper-cased abbreviation, as in
+            st.session_state["team_abbr_to_name"]
         abbreviation: Team abbreviation to look up
 
     Returns:
@@ -126,13 +160,8 @@ def get_team_name_by_abbreviation(
     if len(abbreviation) > 3:
         return abbreviation
 
-    # Look up in teams list
-    for team in teams:
-        if team["abbreviation"].upper() == abbreviation.upper():
-            return team["name"]
-
-    # If not found, return the abbreviation
-    return abbreviation
+    # Look up the team name, if not found return the abbreviation
+    return team_abbr_to_name.get(abbreviation.upper(), abbreviation)
 
 
 def format_team_name(name: str) -> str:
@@ -179,16 +208,59 @@ def get_historical_abbreviation(
     if date_context is None:
         date_context = datetime.now()
 
-    team_info = TEAM_ABBREVIATION_HISTORY.get(team_name)
-    if not team_info:
+    team_period = TEAM_ABBREVIATION_PERIODS.get(team_name)
+    if not team_period:
         return ""
 
-    from_date = datetime.fromisoformat(team_info["from"])
-    to_date = (
-        datetime.fromisoformat(team_info["to"]) if team_info["to"] else datetime.now()
-    )
-
-    if from_date <= date_context <= to_date:
-        return team_info["abbreviation"]
+    abbreviation, from_date, to_date = team_period
+    if from_date <= date_context <= (to_date or datetime.now()):
+        return abbreviation
 
     return ""
+
+
+def add_historical_abbreviation(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    team_col: str = "team_name",
+    date_col: str = "date",
+    alias: str = "historical_abbreviation",
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """
+    Add the historical abbreviation of each row's team at the row's date.
+
+    Vectorized version of get_historical_abbreviation: the periods are joined
+    on the team name and the date interval is checked for all rows at once.
+
+    Args:
+        df: DataFrame or LazyFrame with team name and date columns
+        team_col: Name of the team name column
+        date_col: Name of the date column
+        alias: Name of the added abbreviation column
+
+    Returns:
+        DataFrame or LazyFrame with the abbreviation column, empty string when
+        the team did not use any abbreviation at that date
+    """
+    game_date = pl.col(date_col).cast(pl.Date)
+    in_period = (pl.col("history_from") <= game_date) & (
+        game_date <= pl.col("history_to").fill_null(date.today())
+    )
+
+    return (
+        df.join(
+            TEAM_ABBREVIATION_PERIODS_DF.lazy()
+            if isinstance(df, pl.LazyFrame)
+            else TEAM_ABBREVIATION_PERIODS_DF,
+            left_on=team_col,
+            right_on="history_team_name",
+            how="left",
+            maintain_order="left",
+        )
+        .with_columns(
+            pl.when(in_period)
+            .then(pl.col("history_abbreviation"))
+            .otherwise(pl.lit(""))
+            .alias(alias)
+        )
+        .drop("history_abbreviation", "history_from", "history_to")
+    )
@@ -3,12 +3,13 @@ Team Utilities Module
 Functions for handling team abbreviations and names.
 """
 
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Union
 from datetime import date, datetime
 import json
 from pathlib import Path
 from utils.connection import get_connection
 import polars as pl
+import streamlit as st
 
 # Team abbreviation history
 TEAM_ABBREVIATION_HISTORY = {
@@ -94,22 +95,44 @@ TEAM_ABBREVIATION_HISTORY = {
     },
 }
 
+# Abbreviation periods keyed by upper-cased name, with dates parsed once at import
+TEAM_PERIODS_BY_UPPER_NAME = {
+    name.upper(): (
+        info["abbreviation"],
+        datetime.fromisoformat(info["from"]),
+        datetime.fromisoformat(info["to"]) if info["to"] else None,
+    )
+    for name, info in TEAM_ABBREVIATION_HISTORY.items()
+}
+
+# Location of the team logo files
+TEAM_LOGO_BASE_URL = "https://raw.githubusercontent.com/HTilki/NBAStatsApp/bff918fd85d639dcb23449669f26c0b536a43635/images/teams_logos"
+
+# Abbreviation of each upper-cased team name, for column-wide mappings
+TEAM_NAME_TO_ABBREVIATION = {
+    name_upper: abbreviation
+    for name_upper, (abbreviation, _, _) in TEAM_PERIODS_BY_UPPER_NAME.items()
+}
 
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_teams_data() -> List[Dict[str, Any]]:
     """
-    Load teams data from database or backup file.
+    Load teams data from database or backup file, cached for an hour.
 
     Returns:
         List of team dictionaries
     """
     # Try to load from database first
     try:
-        conn = get_connection()
-        teams_df = pl.read_database(query="SELECT * FROM teams", connection=conn)
-        conn.close()
+        # Rows are used as dicts, so fetch them directly from the cursor
+        with get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("SELECT * FROM teams")
+            columns = [column[0] for column in cursor.description]
+            teams = [dict(zip(columns, row)) for row in cursor.fetchall()]
 
-        if not teams_df.is_empty():
-            return teams_df.rows(named=True)
+        if teams:
+            return teams
     except Exception:
         pass
 
@@ -126,13 +149,13 @@ def load_teams_data() -> List[Dict[str, Any]]:
     ]
 
 
-def get_team_abbreviation(team_name: str, date: Optional[date] = None) -> str:
+def get_team_abbreviation(team_name: str, as_of: Optional[date] = None) -> str:
     """
     Get team abbreviation for a team name, considering historical changes.
 
     Args:
         team_name: Team name
-        date: Date for which to get the abbreviation
+        as_of: Date for which to get the abbreviation
 
     Returns:
         Team abbreviation
@@ -141,43 +164,81 @@ def get_team_abbreviation(team_name: str, date: Optional[date] = None) -> str:
         return ""
 
     # Convert date to datetime if needed
-    if date and not isinstance(date, datetime):
-        date = datetime.combine(date, datetime.min.time())
+    if as_of and not isinstance(as_of, datetime):
+        as_of = datetime.combine(as_of, datetime.min.time())
 
     # Check if team name is already an abbreviation (3 letters)
     if len(team_name) == 3 and team_name.isupper():
         return team_name
 
     # Look up in history
-    for name, info in TEAM_ABBREVIATION_HISTORY.items():
-        if team_name.upper() == name.upper():
-            from_date = datetime.strptime(info["from"], "%Y-%m-%d")
-            to_date = datetime.strptime(info["to"], "%Y-%m-%d") if info["to"] else None
-
-            if date:
-                if from_date <= date and (not to_date or date < to_date):
-                    return info["abbreviation"]
-            else:
-                # If no date specified, return most recent abbreviation
-                if not to_date:
-                    return info["abbreviation"]
-
-    # Try to find by partial match
     team_name_upper = team_name.upper()
-    for name, info in TEAM_ABBREVIATION_HISTORY.items():
-        if team_name_upper in name.upper():
-            return info["abbreviation"]
+    team_period = TEAM_PERIODS_BY_UPPER_NAME.get(team_name_upper)
+    if team_period:
+        abbreviation, from_date, to_date = team_period
+
+        if as_of:
+            if from_date <= as_of and (not to_date or as_of < to_date):
+                return abbreviation
+        else:
+            # If no date specified, return most recent abbreviation
+            if not to_date:
+                return abbreviation
+
+    # Try to find by partial match against the already upper-cased names
+    for name_upper, (abbreviation, _, _) in TEAM_PERIODS_BY_UPPER_NAME.items():
+        if team_name_upper in name_upper:
+            return abbreviation
 
     # If all else fails, return first 3 chars
     return team_name[:3].upper()
 
 
-def get_abbreviation(teams: List[Dict[str, Any]], team_name: str) -> str:
+def add_abbreviation_column(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    team_col: str,
+    alias: str = "abbreviation",
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """
+    Add the abbreviation of each team name of a column in a single pass.
+
+    Column-wide version of get_team_abbreviation without a date: names that
+    are already abbreviations are kept, known names are mapped to their
+    abbreviation and other names fall back to their first 3 characters.
+    Partial name matches are not attempted.
+
+    Args:
+        df: DataFrame or LazyFrame with a team name column
+        team_col: Name of the team name column
+        alias: Name of the added abbreviation column
+
+    Returns:
+        DataFrame or LazyFrame with the abbreviation column
+    """
+    team_name = pl.col(team_col)
+    team_name_upper = team_name.str.to_uppercase()
+
+    return df.with_columns(
+        pl.when((team_name.str.len_chars() == 3) & (team_name == team_name_upper))
+        .then(team_name)
+        .otherwise(
+            team_name_upper.replace_strict(
+                TEAM_NAME_TO_ABBREVIATION,
+                default=team_name_upper.str.slice(0, 3),
+                return_dtype=pl.String,
+            )
+        )
+        .alias(alias)
+    )
+
+
+def get_abbreviation(team_name_to_abbr: Dict[str, str], team_name: str) -> str:
     """
-    Get team abbreviation from a list of team dictionaries.
+    Get team abbreviation from the session team lookup.
 
     Args:
-        teams: List of team dictionaries
+        team_name_to_abbr: Abbreviations keyed by upper-cased team name, as in
+            st.session_state["team_name_to_abbr"]
         team_name: Team name to look up
 
     Returns:
@@ -190,13 +251,8 @@ def get_abbreviation(teams: List[Dict[str, Any]], team_name: str) -> str:
     if len(team_name) == 3 and team_name.isupper():
         return team_name
 
-    # Search in teams list
-    for team in teams:
-        if team["name"].upper() == team_name.upper():
-            return team["abbreviation"]
-
-    # Fall back to the general function
-    return get_team_abbreviation(team_name)
+    # Search in the teams lookup, falling back to the general function
+    return team_name_to_abbr.get(team_name.upper()) or get_team_abbreviation(team_name)
 
 
 def get_team_logo_url(team_abbreviation: str) -> str:
@@ -209,4 +265,17 @@ def get_team_logo_url(team_abbreviation: str) -> str:
     Returns:
         URL for the team's logo
     """
-    return f"https://raw.githubusercontent.com/HTilki/NBAStatsApp/bff918fd85d639dcb23449669f26c0b536a43635/images/teams_logos/{team_abbreviation}.svg"
+    return f"{TEAM_LOGO_BASE_URL}/{team_abbreviation}.svg"
+
+
+def team_logo_url_expr(abbreviation_col: str = "team") -> pl.Expr:
+    """
+    Build the logo URLs of a whole team abbreviation column.
+
+    Args:
+        abbreviation_col: Name of the team abbreviation column
+
+    Returns:
+        Expression with the URL of each team's logo
+    """
+    return pl.format(f"{TEAM_LOGO_BASE_URL}/{{}}.svg", pl.col(abbreviation_col))